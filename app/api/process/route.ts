@@ -89,6 +89,10 @@ interface ProcessingError {
   details?: any
 }
 
+// Posts with different post_ids are independent and their processing is dominated by
+// Supabase/OpenRouter round trips, so a small number are processed concurrently
+const POST_PROCESSING_CONCURRENCY = 4;
+
 // OpenRouter client for intelligent quote extraction
 class OpenRouterClient {
   private apiKey: string
@@ -191,20 +195,23 @@ ${rawAnalysis}`;
 
 
 class AnalysisParser {
+  // Compiled once at module load rather than on every parsed post.
+  // The <relevance_score> tag always takes priority; otherwise one scan covers a
+  // leading number and "score: N" (a leading number matches at 0, so it still wins).
+  private static readonly SCORE_TAG = '<relevance_score>';
+  private static readonly SCORE_TAG_PATTERN = /<relevance_score>(\d+)/;
+  private static readonly SCORE_FALLBACK_PATTERN = /^(\d+)|score:?\s*(\d+)/i;
+  private static readonly QUESTION_FLAG_TAG = '<question_relevance_flag>';
+
   static extractRelevanceScore(content: string): number {
     try {
-      const patterns = [
-        /<relevance_score>(\d+)/,
-        /^(\d+)/,
-        /score:?\s*(\d+)/i
-      ];
-      
-      for (const pattern of patterns) {
-        const match = content.match(pattern);
-        if (match) return parseInt(match[1]);
+      if (content.includes(this.SCORE_TAG)) {
+        const tagMatch = content.match(this.SCORE_TAG_PATTERN);
+        if (tagMatch) return parseInt(tagMatch[1]);
       }
       
-      return 5; // Default score
+      const match = content.match(this.SCORE_FALLBACK_PATTERN);
+      return match ? parseInt(match[1] ?? match[2]) : 5; // Default score
     } catch {
       return 5;
     }
@@ -212,8 +219,10 @@ class AnalysisParser {
 
   static extractQuestionFlag(content: string): boolean {
     try {
-      const match = content.match(/<question_relevance_flag>(TRUE|FALSE)/);
-      return match ? match[1] === 'TRUE' : true;
+      // Fixed literal tag, so a plain substring search is enough
+      const tagIndex = content.indexOf(this.QUESTION_FLAG_TAG);
+      if (tagIndex === -1) return true;
+      return !content.startsWith('FALSE', tagIndex + this.QUESTION_FLAG_TAG.length);
     } catch {
       return true;
     }
@@ -354,6 +363,68 @@ class AnalysisParser {
 }
 
 class QuoteExtractor {
+  // Compiled once at module load rather than on every quote
+  private static readonly METADATA_PATTERNS = [
+    /^relevance_score[:\s]/i,
+    /^indicator[:\s]/i,
+    /^classification[:\s]/i,
+    /^category[:\s]/i,
+    /^sentiment[:\s]/i,
+    /^\d+\s*-\s*(the|this|analysis)/i, // "8 - The post discusses..."
+    /^(analysis shows|the analysis|this analysis)/i,
+    /^(the post discusses|this post discusses)/i
+  ];
+  private static readonly RELEVANT_ATTR = /is_question_relevant="(true|false)"/;
+  private static readonly SENTIMENT_ATTR = /sentiment="([^"]*?)"/;
+  private static readonly THEME_ATTR = /theme="([^"]*?)"/;
+  private static readonly JUSTIFICATION_ATTR = /justification="([^"]*?)"/;
+  private static readonly POST_ID_PREFIX = /^[A-Za-z]+-[A-Za-z0-9]+:\s*/;
+  private static readonly SECTION_PATTERNS = new Map<string, RegExp>();
+  private static readonly STRUCTURED_SECTION_PATTERN = /<(user_needs|user_language|current_solutions|feature_signals)>([\s\S]*?)<\/\1>/g;
+  private static readonly QUOTE_TAG_PATTERN = /<quote[^>]*>(.*?)<\/quote>/g;
+  private static readonly GENERIC_QUOTE_PATTERN = /<quote[^>]*?(?:category="([^"]*?)")?[^>]*?(?:sentiment="([^"]*?)")?[^>]*?(?:theme="([^"]*?)")?[^>]*?>(.*?)<\/quote>/g;
+  private static readonly QUOTED_TEXT_PATTERNS = [
+    /"([^"]{20,500})"/g,           // Double quotes
+    /'([^']{20,500})'/g,           // Single quotes
+    /["""]([^"""]{20,500})["""]/g  // Smart quotes
+  ];
+  // Tested against one already-split sentence at a time. The former
+  // /[^.!?]*keyword[^.!?]*[.!?]/g scans backtracked quadratically over long
+  // unterminated runs of text; splitting first keeps the fallback linear.
+  private static readonly SENTENCE_PATTERNS = [
+    // Sentences with emotional indicators
+    /love|hate|frustrated|annoying|difficult|easy|wish|need|want|hope|disappointed|excited/i,
+    // Sentences with first person pronouns
+    /(?:I|me|my|we|our|us)\s/i,
+    // Sentences that express problems or solutions
+    /problem|issue|solution|feature|bug|works?|doesn't work|broken/i
+  ];
+  private static readonly SENTENCE_TERMINATOR = /([.!?])/;
+
+  /**
+   * Split text into sentences that end in . ! or ?, dropping any unterminated tail
+   */
+  private static splitSentences(text: string): string[] {
+    const parts = text.split(this.SENTENCE_TERMINATOR);
+    const sentences: string[] = [];
+    for (let i = 0; i + 1 < parts.length; i += 2) {
+      sentences.push(parts[i] + parts[i + 1]);
+    }
+    return sentences;
+  }
+
+  /**
+   * Get the (cached) pattern matching the body of a <sectionName> block
+   */
+  private static sectionPattern(sectionName: string): RegExp {
+    let pattern = this.SECTION_PATTERNS.get(sectionName);
+    if (!pattern) {
+      pattern = new RegExp(`<${sectionName}>([\\s\\S]*?)<\\/${sectionName}>`);
+      this.SECTION_PATTERNS.set(sectionName, pattern);
+    }
+    return pattern;
+  }
+
   /**
    * Validate quote quality and reject malformed quotes
    */
@@ -367,19 +438,7 @@ class QuoteExtractor {
     if (text.includes('<') || text.includes('</') || text.includes('/>')) return false;
     
     // Reject ONLY obvious analysis metadata - be very specific
-    const metadataPatterns = [
-      /^relevance_score[:\s]/i,
-      /^indicator[:\s]/i,
-      /^classification[:\s]/i,
-      /^category[:\s]/i,
-      /^sentiment[:\s]/i,
-      /^\d+\s*-\s*(the|this|analysis)/i, // "8 - The post discusses..."
-      /^(analysis shows|the analysis|this analysis)/i,
-      /^(the post discusses|this post discusses)/i
-    ];
-    
-    // Only reject if it clearly matches metadata patterns
-    if (metadataPatterns.some(pattern => pattern.test(text))) return false;
+    if (this.METADATA_PATTERNS.some(pattern => pattern.test(text))) return false;
     
     // Accept everything else - let the AI determine what's valuable
     return true;
@@ -406,30 +465,39 @@ class QuoteExtractor {
     return quote;
   }
   static extractQuotesFromSection(content: string, sectionName: string): Array<{text: string, is_question_relevant: boolean, sentiment: string, theme: string, justification?: string}> {
+    const sectionMatch = content.match(this.sectionPattern(sectionName));
+    return sectionMatch ? this.extractQuotesFromSectionBody(sectionMatch[1], sectionName) : [];
+  }
+
+  /**
+   * Split the structured analysis sections out of the raw analysis in a single scan.
+   * Only the first occurrence of each section is kept, matching extractQuotesFromSection.
+   */
+  private static splitStructuredSections(content: string): Map<string, string> {
+    const sections = new Map<string, string>();
+    for (const match of content.matchAll(this.STRUCTURED_SECTION_PATTERN)) {
+      if (!sections.has(match[1])) {
+        sections.set(match[1], match[2]);
+      }
+    }
+    return sections;
+  }
+
+  private static extractQuotesFromSectionBody(sectionContent: string, sectionName: string): Array<{text: string, is_question_relevant: boolean, sentiment: string, theme: string, justification?: string}> {
     const quotes: Array<{text: string, is_question_relevant: boolean, sentiment: string, theme: string, justification?: string}> = [];
     
     try {
-      const sectionRegex = new RegExp(`<${sectionName}>([\\s\\S]*?)<\\/${sectionName}>`);
-      const sectionMatch = content.match(sectionRegex);
-      
-      if (!sectionMatch) return quotes;
-      
-      const sectionContent = sectionMatch[1];
-      
       // Find all quote tags and extract attributes flexibly to preserve AI justifications
-      const quotePattern = /<quote[^>]*>(.*?)<\/quote>/g;
-      
-      let match: RegExpExecArray | null;
-      while ((match = quotePattern.exec(sectionContent)) !== null) {
+      for (const match of sectionContent.matchAll(this.QUOTE_TAG_PATTERN)) {
         const fullTag = match[0];
         const text = this.cleanQuoteText(match[1]);
         
         if (text.length > 10) {
           // Extract attributes individually using flexible patterns (any order)
-          const isRelevant = /is_question_relevant="(true|false)"/.exec(fullTag)?.[1] === 'true' || true;
-          const sentiment = /sentiment="([^"]*?)"/.exec(fullTag)?.[1] || 'neutral';
-          const theme = /theme="([^"]*?)"/.exec(fullTag)?.[1] || 'general';
-          const justification = /justification="([^"]*?)"/.exec(fullTag)?.[1];
+          const isRelevant = this.RELEVANT_ATTR.exec(fullTag)?.[1] === 'true' || true;
+          const sentiment = this.SENTIMENT_ATTR.exec(fullTag)?.[1] || 'neutral';
+          const theme = this.THEME_ATTR.exec(fullTag)?.[1] || 'general';
+          const justification = this.JUSTIFICATION_ATTR.exec(fullTag)?.[1];
           
           const quote: any = {
             text: text,
@@ -458,10 +526,19 @@ class QuoteExtractor {
   }
 
   private static cleanQuoteText(text: string): string {
-    return text
-      .replace(/^[A-Za-z]+-[A-Za-z0-9]+:\s*/, '')
-      .replace(/^["']|["']$/g, '')
-      .trim();
+    let cleaned = text.trim();
+    
+    // Drop a leading post id ("abc-123: ...") by slicing past the match
+    const prefix = this.POST_ID_PREFIX.exec(cleaned);
+    if (prefix) cleaned = cleaned.slice(prefix[0].length);
+    
+    // Drop one wrapping quote character at each end
+    let start = 0;
+    let end = cleaned.length;
+    if (start < end && (cleaned[start] === '"' || cleaned[start] === "'")) start++;
+    if (end > start && (cleaned[end - 1] === '"' || cleaned[end - 1] === "'")) end--;
+    
+    return start === 0 && end === cleaned.length ? cleaned : cleaned.slice(start, end).trim();
   }
 
   static async extractAllQuotes(rawAnalysis: string): Promise<{ quotes: ParsedQuote[], errors: ProcessingError[], fallbacksUsed: string[] }> {
@@ -540,9 +617,15 @@ class QuoteExtractor {
       { name: 'feature_signals', category: 'feature_signals' }
     ];
     
+    // One pass over the analysis instead of one scan per section
+    const sectionBodies = this.splitStructuredSections(rawAnalysis);
+    
     for (const section of sections) {
+      const sectionContent = sectionBodies.get(section.name);
+      if (sectionContent === undefined) continue;
+      
       try {
-        const sectionQuotes = this.extractQuotesFromSection(rawAnalysis, section.name);
+        const sectionQuotes = this.extractQuotesFromSectionBody(sectionContent, section.name);
         sectionQuotes.forEach(quote => {
           try {
             const normalizedQuote = this.normalizeQuote({
@@ -572,10 +655,7 @@ class QuoteExtractor {
     
     try {
       // Look for any <quote> tags regardless of context
-      const genericPattern = /<quote[^>]*?(?:category="([^"]*?)")?[^>]*?(?:sentiment="([^"]*?)")?[^>]*?(?:theme="([^"]*?)")?[^>]*?>(.*?)<\/quote>/g;
-      let match: RegExpExecArray | null;
-      
-      while ((match = genericPattern.exec(rawAnalysis)) !== null) {
+      for (const match of rawAnalysis.matchAll(this.GENERIC_QUOTE_PATTERN)) {
         const text = this.cleanQuoteText(match[4]);
         if (text.length > 10) {
           try {
@@ -604,15 +684,8 @@ class QuoteExtractor {
     
     try {
       // Look for text in various quote marks
-      const patterns = [
-        /"([^"]{20,500})"/g,           // Double quotes
-        /'([^']{20,500})'/g,           // Single quotes
-        /["""]([^"""]{20,500})["""]/g  // Smart quotes
-      ];
-      
-      for (const pattern of patterns) {
-        let match: RegExpExecArray | null;
-        while ((match = pattern.exec(rawAnalysis)) !== null) {
+      for (const pattern of this.QUOTED_TEXT_PATTERNS) {
+        for (const match of rawAnalysis.matchAll(pattern)) {
           const text = match[1].trim();
           if (text.length > 20 && text.length < 500) {
             try {
@@ -644,19 +717,13 @@ class QuoteExtractor {
     
     try {
       // Look for complete sentences that might be user feedback
-      const sentencePatterns = [
-        // Sentences with emotional indicators
-        /([^.!?]*(?:love|hate|frustrated|annoying|difficult|easy|wish|need|want|hope|disappointed|excited)[^.!?]*[.!?])/gi,
-        // Sentences with first person pronouns
-        /([^.!?]*(?:I|me|my|we|our|us)\s+[^.!?]*[.!?])/gi,
-        // Sentences that express problems or solutions
-        /([^.!?]*(?:problem|issue|solution|feature|bug|works?|doesn't work|broken)[^.!?]*[.!?])/gi
-      ];
+      const sentences = this.splitSentences(rawAnalysis);
       
-      for (const pattern of sentencePatterns) {
-        let match: RegExpExecArray | null;
-        while ((match = pattern.exec(rawAnalysis)) !== null) {
-          const text = match[1].trim();
+      for (const pattern of this.SENTENCE_PATTERNS) {
+        for (const sentence of sentences) {
+          if (!pattern.test(sentence)) continue;
+          
+          const text = sentence.trim();
           if (text.length > 30 && text.length < 300) {
             try {
               const normalizedQuote = this.normalizeQuote({
@@ -1075,49 +1142,74 @@ export async function POST(request: NextRequest) {
     const errorBreakdown: Record<string, number> = {};
     const allErrors: ProcessingError[] = [];
     
-    // Process each post with guaranteed non-failing approach
-    for (const post of data.posts) {
-      try {
-        const result = await PostProcessor.processPost(post, data.run_id);
-        
-        // Track successes
-        if (result.postSaved) {
-          totalPostsSaved++;
-        }
-        
-        totalQuotes += result.quotesCount;
-        
-        // Track fallbacks used
-        result.fallbacksUsed.forEach(fallback => allFallbacks.add(fallback));
-        
-        // Track errors
-        if (result.errors.length > 0) {
-          totalErrors += result.errors.length;
-          allErrors.push(...result.errors);
-          
-          // Count error types
-          result.errors.forEach(error => {
-            errorBreakdown[error.type] = (errorBreakdown[error.type] || 0) + 1;
-          });
-        }
-        
-        // Partial success: post saved but had some issues
-        if (result.postSaved && result.errors.length > 0) {
-          partialSuccesses++;
+    // Process posts a few at a time with guaranteed non-failing approach.
+    // insertPost merges into any existing row (read, then write), so entries sharing a
+    // post_id share a lane and run one after another; distinct lanes run concurrently.
+    const lanes = new Map<string, number[]>();
+    data.posts.forEach((post, index) => {
+      const key = post.post_id || `__no_post_id_${index}`;
+      const lane = lanes.get(key);
+      if (lane) {
+        lane.push(index);
+      } else {
+        lanes.set(key, [index]);
+      }
+    });
+    const laneList = Array.from(lanes.values());
+    
+    // Sized up front so each result is written into its slot by index
+    const results = new Array<ProcessingResult | { error: any }>(data.posts.length);
+    for (let i = 0; i < laneList.length; i += POST_PROCESSING_CONCURRENCY) {
+      await Promise.all(laneList.slice(i, i + POST_PROCESSING_CONCURRENCY).map(async lane => {
+        for (const index of lane) {
+          results[index] = await PostProcessor.processPost(data.posts[index], data.run_id)
+            .catch(error => ({ error }));
         }
-        
-      } catch (error: any) {
+      }));
+    }
+    
+    // Tally results in input order
+    data.posts.forEach((post, index) => {
+      const result = results[index];
+      if ('error' in result) {
         // This should never happen with our graceful approach, but just in case
         totalErrors++;
         const fallbackError: ProcessingError = {
           type: 'validation',
-          message: `Unexpected error processing post: ${error.message}`,
+          message: `Unexpected error processing post: ${result.error.message}`,
           details: post.post_id || 'unknown'
         };
         allErrors.push(fallbackError);
         errorBreakdown['validation'] = (errorBreakdown['validation'] || 0) + 1;
+        return;
       }
-    }
+      
+      // Track successes
+      if (result.postSaved) {
+        totalPostsSaved++;
+      }
+      
+      totalQuotes += result.quotesCount;
+      
+      // Track fallbacks used
+      result.fallbacksUsed.forEach(fallback => allFallbacks.add(fallback));
+      
+      // Track errors
+      if (result.errors.length > 0) {
+        totalErrors += result.errors.length;
+        allErrors.push(...result.errors);
+        
+        // Count error types
+        result.errors.forEach(error => {
+          errorBreakdown[error.type] = (errorBreakdown[error.type] || 0) + 1;
+        });
+      }
+      
+      // Partial success: post saved but had some issues
+      if (result.postSaved && result.errors.length > 0) {
+        partialSuccesses++;
+      }
+    });
 
     // Update response with collected data
     response.posts_processed = data.posts.length;
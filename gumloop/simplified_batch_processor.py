@@ -89,9 +89,16 @@ def function(analyzed_posts_list, run_id, subreddit_name, webhook_base_url):
             "User-Agent": "Gumloop-PostFormatter/1.0"
         }
         
+        # Serialize with orjson when the node environment has it (bytes out, no re-encode)
+        try:
+            import orjson
+            webhook_body = orjson.dumps(webhook_payload)
+        except ImportError:
+            webhook_body = json.dumps(webhook_payload).encode("utf-8")
+        
         webhook_response_raw = requests.post(
             webhook_url,
-            json=webhook_payload,
+            data=webhook_body,
             headers=headers,
             timeout=60
         )
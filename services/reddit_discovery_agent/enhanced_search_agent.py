@@ -38,12 +38,15 @@ client = OpenAI(
 )
 
 class EnhancedSearchAgent:
-    def __init__(self, product_type, problem_area, target_audience, additional_context=None, search_mode="validation"):
+    def __init__(self, product_type, problem_area, target_audience, additional_context=None, search_mode="validation",
+                 session: Optional[aiohttp.ClientSession] = None):
         self.product_type = product_type
         self.problem_area = problem_area
         self.target_audience = target_audience
         self.additional_context = additional_context or ""
         self.search_mode = search_mode
+        # Shared HTTP session for Perplexity/Firecrawl calls; opened per discovery if not given
+        self.session = session
         self.perplexity_api_key = os.getenv("PERPLEXITY_API_KEY")
         self.firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY")
         
@@ -89,8 +92,16 @@ class EnhancedSearchAgent:
 
     async def discover_subreddits(self) -> Dict[str, Any]:
         """
-        Main method to discover relevant subreddits using multiple approaches
+        Main method to discover relevant subreddits using multiple approaches.
+        Reuses the agent's session if one was given, otherwise opens one for the whole discovery.
         """
+        if self.session is not None:
+            return await self._discover_subreddits(self.session)
+        
+        async with aiohttp.ClientSession() as session:
+            return await self._discover_subreddits(session)
+
+    async def _discover_subreddits(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
         console.print(Panel.fit(
             f"🔍 Enhanced Subreddit Discovery\n"
             f"Product: {self.product_type}\n"
@@ -112,7 +123,7 @@ class EnhancedSearchAgent:
         # 1. Use Perplexity for intelligent subreddit discovery
         if self.perplexity_api_key:
             try:
-                perplexity_results = await self._discover_with_perplexity()
+                perplexity_results = await self._discover_with_perplexity(session)
                 discovery_results["perplexity_subreddits"] = perplexity_results
                 all_subreddits.update([r["name"] for r in perplexity_results])
             except Exception as e:
@@ -124,7 +135,7 @@ class EnhancedSearchAgent:
         # 2. Use Firecrawl to search Reddit for relevant discussions
         if self.firecrawl_api_key:
             try:
-                firecrawl_results = await self._discover_with_firecrawl()
+                firecrawl_results = await self._discover_with_firecrawl(session)
                 discovery_results["firecrawl_subreddits"] = firecrawl_results
                 all_subreddits.update([r["name"] for r in firecrawl_results])
             except Exception as e:
@@ -152,7 +163,7 @@ class EnhancedSearchAgent:
         
         return discovery_results
 
-    async def _discover_with_perplexity(self) -> List[Dict[str, Any]]:
+    async def _discover_with_perplexity(self, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
         """
         Use Perplexity AI to intelligently discover relevant subreddits
         """
@@ -171,7 +182,7 @@ class EnhancedSearchAgent:
         for i, query in enumerate(queries, 1):
             try:
                 console.print(f"[dim]🔍 Perplexity query {i}/{len(queries)}: {query[:80]}...[/dim]")
-                subreddits = await self._query_perplexity(query)
+                subreddits = await self._query_perplexity(query, session)
                 console.print(f"[green]✓ Found {len(subreddits)} subreddits from query {i}[/green]")
                 all_subreddits.extend(subreddits)
                 await asyncio.sleep(1)  # Rate limiting
@@ -186,10 +197,14 @@ class EnhancedSearchAgent:
         
         return list(unique_subreddits.values())
 
-    async def _query_perplexity(self, query: str) -> List[Dict[str, Any]]:
+    async def _query_perplexity(self, query: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
         """
         Query Perplexity API for subreddit recommendations
         """
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._query_perplexity(query, session)
+        
         url = "https://api.perplexity.ai/chat/completions"
         
         payload = {
@@ -224,18 +239,17 @@ class EnhancedSearchAgent:
         }
         
         timeout = aiohttp.ClientTimeout(total=60)  # 60 second timeout
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    content = data["choices"][0]["message"]["content"]
-                    return self._extract_subreddits_from_text(content, source="perplexity")
-                else:
-                    error_text = await response.text()
-                    console.print(f"[red]Perplexity API error {response.status}: {error_text[:200]}...[/red]")
-                    return []
+        async with session.post(url, json=payload, headers=headers, timeout=timeout) as response:
+            if response.status == 200:
+                data = await response.json()
+                content = data["choices"][0]["message"]["content"]
+                return self._extract_subreddits_from_text(content, source="perplexity")
+            else:
+                error_text = await response.text()
+                console.print(f"[red]Perplexity API error {response.status}: {error_text[:200]}...[/red]")
+                return []
 
-    async def _discover_with_firecrawl(self) -> List[Dict[str, Any]]:
+    async def _discover_with_firecrawl(self, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
         """
         Use Firecrawl to search Reddit for relevant discussions and extract subreddits
         """
@@ -254,7 +268,7 @@ class EnhancedSearchAgent:
         for i, query in enumerate(search_queries, 1):
             try:
                 console.print(f"[dim]🔥 Firecrawl search {i}/{len(search_queries)}: {query[:80]}...[/dim]")
-                subreddits = await self._search_with_firecrawl(query)
+                subreddits = await self._search_with_firecrawl(query, session)
                 console.print(f"[green]✓ Found {len(subreddits)} subreddits from search {i}[/green]")
                 all_subreddits.extend(subreddits)
                 await asyncio.sleep(2)  # Rate limiting
@@ -269,11 +283,15 @@ class EnhancedSearchAgent:
         
         return list(unique_subreddits.values())
 
-    async def _search_with_firecrawl(self, query: str) -> List[Dict[str, Any]]:
+    async def _search_with_firecrawl(self, query: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
         """
         Search using Firecrawl and extract subreddit information
         Enhanced with better search strategies and MCP compatibility
         """
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._search_with_firecrawl(query, session)
+        
         # Try MCP tool first if available
         if MCP_AVAILABLE:
             try:
@@ -299,28 +317,27 @@ class EnhancedSearchAgent:
         }
         
         timeout = aiohttp.ClientTimeout(total=60)  # 60 second timeout
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    subreddits = []
-                    
-                    for result in data.get("data", []):
-                        # Extract subreddits from URLs and content
-                        url_subreddits = self._extract_subreddits_from_url(result.get("url", ""))
-                        content_subreddits = self._extract_subreddits_from_text(
-                            result.get("markdown", "") or result.get("content", ""), 
-                            source="firecrawl"
-                        )
-                        
-                        subreddits.extend(url_subreddits)
-                        subreddits.extend(content_subreddits)
+        async with session.post(url, json=payload, headers=headers, timeout=timeout) as response:
+            if response.status == 200:
+                data = await response.json()
+                subreddits = []
+                
+                for result in data.get("data", []):
+                    # Extract subreddits from URLs and content
+                    url_subreddits = self._extract_subreddits_from_url(result.get("url", ""))
+                    content_subreddits = self._extract_subreddits_from_text(
+                        result.get("markdown", "") or result.get("content", ""), 
+                        source="firecrawl"
+                    )
                     
-                    return subreddits
-                else:
-                    error_data = await response.text()
-                    console.print(f"[red]Firecrawl API error {response.status}: {error_data[:200]}...[/red]")
-                    return []
+                    subreddits.extend(url_subreddits)
+                    subreddits.extend(content_subreddits)
+                
+                return subreddits
+            else:
+                error_data = await response.text()
+                console.print(f"[red]Firecrawl API error {response.status}: {error_data[:200]}...[/red]")
+                return []
 
     async def _search_with_firecrawl_mcp(self, query: str) -> List[Dict[str, Any]]:
         """
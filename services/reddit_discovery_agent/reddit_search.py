@@ -1,10 +1,20 @@
 import os
+import re
 import random
 import asyncio
 import aiohttp
 import logging
+import tempfile
+from typing import Optional
 from rich.console import Console
 
+# Optional on-disk cache for Reddit search responses
+try:
+    import diskcache
+    DISK_CACHE_AVAILABLE = True
+except ImportError:
+    DISK_CACHE_AVAILABLE = False
+
 # Setup console for better output
 console = Console()
 
@@ -26,8 +36,35 @@ FALLBACK_SUBREDDITS = [
     "r/sideproject", "r/programming", "r/growmybusiness", "r/dataisbeautiful"
 ]
 
-async def search_reddit_json(query: str) -> list:
-    """Search Reddit directly using their JSON API for search"""
+# Cache search results across runs; Reddit's rankings are stable for several minutes
+SEARCH_CACHE_TTL = 600  # seconds
+_CACHE = diskcache.Cache(
+    os.path.join(tempfile.gettempdir(), "reddit_search_cache"),
+    size_limit=100 * 1024 * 1024
+) if DISK_CACHE_AVAILABLE else None
+
+# Matches a leading "r/" or "/r/" (any case) on subreddit names
+_SUBREDDIT_PREFIX = re.compile(r'^/?r/', re.IGNORECASE)
+
+def _add_subreddit(found: dict, name: str, prefixed: bool = False) -> None:
+    """
+    Record a subreddit as "r/<name>", deduplicating case-insensitively while keeping
+    the first-seen casing for display. Prefixed names that aren't r/ (e.g. "u/foo"
+    user profiles) are kept unchanged.
+    """
+    match = _SUBREDDIT_PREFIX.match(name)
+    if match:
+        name = name[match.end():]
+    elif prefixed:
+        found.setdefault(name.lower(), name)
+        return
+    found.setdefault(name.lower(), f"r/{name}")
+
+async def search_reddit_json(query: str, session: Optional[aiohttp.ClientSession] = None) -> list:
+    """
+    Search Reddit directly using their JSON API for search.
+    Reuses the given session if provided, otherwise opens a temporary one.
+    """
     url = "https://www.reddit.com/search.json"
     params = {
         "q": query,
@@ -45,42 +82,64 @@ async def search_reddit_json(query: str) -> list:
     console.print(f"Searching Reddit JSON API for: {query}")
     logger.info(f"Searching Reddit JSON API for: {query}")
     
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, params=params, headers=headers, timeout=15) as response:
-                if response.status != 200:
-                    console.print(f"[yellow]Error: Reddit search returned status {response.status}[/yellow]")
-                    logger.warning(f"Error: Reddit search returned status {response.status}")
-                    return []
-                
-                data = await response.json()
-                
-                # Extract subreddit mentions from the JSON response
-                subreddits = set()
-                
-                # Process the search results
-                if "data" in data and "children" in data["data"]:
-                    for post in data["data"]["children"]:
-                        post_data = post.get("data", {})
-                        
-                        # Get the subreddit from the post data
-                        if "subreddit_name_prefixed" in post_data:
-                            subreddits.add(post_data["subreddit_name_prefixed"])
-                        elif "subreddit" in post_data:
-                            subreddits.add(f"r/{post_data['subreddit']}")
-                
-                subreddit_list = list(subreddits)
-                console.print(f"Found {len(subreddit_list)} subreddits via Reddit JSON API")
-                logger.info(f"Found {len(subreddit_list)} subreddits via Reddit JSON API")
-                return subreddit_list
-                
-        except Exception as e:
-            console.print(f"[bold red]Error in Reddit search: {str(e)}[/bold red]")
-            logger.error(f"Error in Reddit search: {str(e)}")
-            return []
+    # Check the disk cache first
+    cache_key = ("search", query)
+    if _CACHE is not None:
+        cached = _CACHE.get(cache_key)
+        if cached is not None:
+            console.print(f"[cyan]Using cached Reddit search results for: {query}[/cyan]")
+            return cached
+    
+    # Create a new session if none provided
+    close_session = False
+    if session is None:
+        session = aiohttp.ClientSession()
+        close_session = True
+        
+    try:
+        async with session.get(url, params=params, headers=headers, timeout=15) as response:
+            if response.status != 200:
+                console.print(f"[yellow]Error: Reddit search returned status {response.status}[/yellow]")
+                logger.warning(f"Error: Reddit search returned status {response.status}")
+                return []
+            
+            data = await response.json()
+            
+            # Extract subreddit mentions from the JSON response, keeping Reddit's relevance order
+            subreddits = {}
+            
+            # Process the search results
+            if "data" in data and "children" in data["data"]:
+                for post in data["data"]["children"]:
+                    post_data = post.get("data", {})
+                    
+                    # Get the subreddit from the post data
+                    if "subreddit_name_prefixed" in post_data:
+                        _add_subreddit(subreddits, post_data["subreddit_name_prefixed"], prefixed=True)
+                    elif "subreddit" in post_data:
+                        _add_subreddit(subreddits, post_data["subreddit"])
+            
+            subreddit_list = list(subreddits.values())
+            console.print(f"Found {len(subreddit_list)} subreddits via Reddit JSON API")
+            logger.info(f"Found {len(subreddit_list)} subreddits via Reddit JSON API")
+            if _CACHE is not None:
+                _CACHE.set(cache_key, subreddit_list, expire=SEARCH_CACHE_TTL)
+            return subreddit_list
+            
+    except Exception as e:
+        console.print(f"[bold red]Error in Reddit search: {str(e)}[/bold red]")
+        logger.error(f"Error in Reddit search: {str(e)}")
+        return []
+    finally:
+        # Close the session if we created it
+        if close_session:
+            await session.close()
 
-async def search_top_subreddits(query: str) -> list:
-    """Get top subreddits from Reddit's directory"""
+async def search_top_subreddits(query: str, session: Optional[aiohttp.ClientSession] = None) -> list:
+    """
+    Get top subreddits from Reddit's directory.
+    Reuses the given session if provided, otherwise opens a temporary one.
+    """
     url = "https://www.reddit.com/subreddits.json"
     
     headers = {
@@ -91,58 +150,80 @@ async def search_top_subreddits(query: str) -> list:
     console.print(f"Getting popular subreddits related to: {query}")
     logger.info(f"Getting popular subreddits related to: {query}")
     
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, headers=headers, timeout=15) as response:
-                if response.status != 200:
-                    console.print(f"[yellow]Error: Subreddit directory returned status {response.status}[/yellow]")
-                    logger.warning(f"Error: Subreddit directory returned status {response.status}")
-                    return []
-                
-                data = await response.json()
-                
-                # Extract subreddits from the directory
-                subreddits = set()
-                
-                # Process the results
-                if "data" in data and "children" in data["data"]:
-                    for subreddit in data["data"]["children"]:
-                        subreddit_data = subreddit.get("data", {})
-                        
-                        # Only include relevant subreddits based on query terms
-                        name = subreddit_data.get("display_name", "")
-                        title = subreddit_data.get("title", "")
-                        description = subreddit_data.get("public_description", "")
-                        
-                        # Simple relevance check
-                        combined_text = (name + " " + title + " " + description).lower()
-                        query_terms = query.lower().split()
-                        
-                        if any(term in combined_text for term in query_terms):
-                            subreddits.add(f"r/{name}")
-                
-                subreddit_list = list(subreddits)
-                console.print(f"Found {len(subreddit_list)} relevant subreddits in directory")
-                logger.info(f"Found {len(subreddit_list)} relevant subreddits in directory")
-                return subreddit_list
-                
-        except Exception as e:
-            console.print(f"[bold red]Error in subreddit directory search: {str(e)}[/bold red]")
-            logger.error(f"Error in subreddit directory search: {str(e)}")
-            return []
+    # Check the disk cache first
+    cache_key = ("subreddits", query)
+    if _CACHE is not None:
+        cached = _CACHE.get(cache_key)
+        if cached is not None:
+            console.print(f"[cyan]Using cached subreddit directory results for: {query}[/cyan]")
+            return cached
+    
+    # Create a new session if none provided
+    close_session = False
+    if session is None:
+        session = aiohttp.ClientSession()
+        close_session = True
+        
+    try:
+        async with session.get(url, headers=headers, timeout=15) as response:
+            if response.status != 200:
+                console.print(f"[yellow]Error: Subreddit directory returned status {response.status}[/yellow]")
+                logger.warning(f"Error: Subreddit directory returned status {response.status}")
+                return []
+            
+            data = await response.json()
+            
+            # Extract subreddits from the directory, keeping the directory's ranking order
+            subreddits = {}
+            
+            # Match any query term in a single regex scan per subreddit
+            query_terms = query.casefold().split()
+            query_pattern = re.compile("|".join(re.escape(term) for term in query_terms)) if query_terms else None
+            
+            # Process the results
+            if query_pattern and "data" in data and "children" in data["data"]:
+                for subreddit in data["data"]["children"]:
+                    subreddit_data = subreddit.get("data", {})
+                    
+                    # Only include relevant subreddits based on query terms
+                    name = subreddit_data.get("display_name", "")
+                    title = subreddit_data.get("title", "")
+                    description = subreddit_data.get("public_description", "")
+                    
+                    # Simple relevance check
+                    combined_text = f"{name} {title} {description}".casefold()
+                    
+                    if query_pattern.search(combined_text):
+                        _add_subreddit(subreddits, name)
+            
+            subreddit_list = list(subreddits.values())
+            console.print(f"Found {len(subreddit_list)} relevant subreddits in directory")
+            logger.info(f"Found {len(subreddit_list)} relevant subreddits in directory")
+            if _CACHE is not None:
+                _CACHE.set(cache_key, subreddit_list, expire=SEARCH_CACHE_TTL)
+            return subreddit_list
+            
+    except Exception as e:
+        console.print(f"[bold red]Error in subreddit directory search: {str(e)}[/bold red]")
+        logger.error(f"Error in subreddit directory search: {str(e)}")
+        return []
+    finally:
+        # Close the session if we created it
+        if close_session:
+            await session.close()
 
-async def find_subreddits(query: str) -> list:
+async def find_subreddits(query: str, session: Optional[aiohttp.ClientSession] = None) -> list:
     """Main function to find subreddits with fallbacks"""
     console.print(f"Finding subreddits for query: {query}")
     logger.info(f"Finding subreddits for query: {query}")
     
     # Try Reddit search JSON API first
-    reddit_results = await search_reddit_json(query)
+    reddit_results = await search_reddit_json(query, session=session)
     if reddit_results:
         return reddit_results
     
     # Then try top subreddits
-    top_results = await search_top_subreddits(query)
+    top_results = await search_top_subreddits(query, session=session)
     if top_results:
         return top_results
     
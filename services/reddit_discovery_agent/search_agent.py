@@ -1,6 +1,11 @@
 import os
 import time
+import functools
+import hashlib
+import bisect
+import importlib
 import random
+import tempfile
 import uuid
 import json
 import asyncio
@@ -24,6 +29,38 @@ try:
 except ImportError:
     ENHANCED_DISCOVERY_AVAILABLE = False
 
+# Use orjson for hot-path JSON parsing when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError so existing except clauses still apply
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_sorted(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps_sorted(obj):
+        return json.dumps(obj, sort_keys=True).encode()
+
+# Optional on-disk store for the exact query cache, so generated queries survive across runs
+try:
+    import diskcache
+    DISK_CACHE_AVAILABLE = True
+except ImportError:
+    DISK_CACHE_AVAILABLE = False
+
+# Optional local embedding model for the semantic query cache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -60,9 +97,188 @@ FALLBACK_SUBREDDITS = [
     "r/sideproject", "r/programming", "r/growmybusiness", "r/dataisbeautiful"
 ]
 
+# Matches subreddit mentions like "r/startups" in free text
+SUBREDDIT_MENTION_PATTERN = re.compile(r'r/[a-zA-Z0-9_]{3,21}', re.IGNORECASE)
+
+def _by_subscribers_desc(sub):
+    """Sort key placing the largest subreddits first."""
+    return -sub.get('subscribers', 0)
+
+def _retrieve_task_exception(task):
+    """Done callback marking a background task's exception as retrieved, so unawaited failures aren't reported."""
+    if not task.cancelled():
+        task.exception()
+
+# Semantic query cache settings
+QUERY_CACHE_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+QUERY_CACHE_SIMILARITY_THRESHOLD = 0.95
+QUERY_CACHE_TTL = 24 * 60 * 60  # seconds
+QUERY_CACHE_SEMANTIC_MAX = 256  # Most recent embeddings kept for near matches
+_embedding_model = None  # Loaded on first use
+
+# Generated queries are shared across agents (and across runs when diskcache is installed).
+# Entries record the agent that produced them; an agent never reuses its own entries,
+# since repeating a previous iteration's queries would defeat the iterative search.
+_QUERY_CACHE_DISK = diskcache.Cache(
+    os.path.join(tempfile.gettempdir(), "reddit_query_cache"),
+    size_limit=20 * 1024 * 1024
+) if DISK_CACHE_AVAILABLE else None
+_QUERY_CACHE_EXACT = {}  # signature -> (owner, queries) when diskcache is unavailable
+_QUERY_CACHE_SEMANTIC = []  # (owner, normalized signature embedding, queries) for near matches
+
 # Reddit search functions have been moved to reddit_search.py
 
+@functools.lru_cache(maxsize=32)
+def _build_screening_prompt(product_type, problem_area, target_audience, additional_context):
+    """
+    Render the static parts of the relevance screening prompt once per product.
+    Returns a (prefix, suffix) pair that wraps the list of subreddits to evaluate.
+    """
+    prefix = f"""
+You are a Reddit relevance expert with EXTREMELY HIGH STANDARDS for determining relevance to a specific product market. 
+Your task is to evaluate which subreddits from a given list are DIRECTLY relevant to our specific product/market niche. 
+Be EXTREMELY STRICT in your evaluations, rejecting anything that isn't a perfect fit.
+
+<product_information>
+- Product Type: {product_type}
+- Problem Area: {problem_area}
+- Target Audience: {target_audience}
+- Additional Context: {additional_context or "None provided"}
+</product_information>
+
+<subreddits_to_evaluate>
+"""
+
+    suffix = """
+</subreddits_to_evaluate>
+
+<evaluation_criteria>
+A subreddit is ONLY relevant if it meets AT LEAST TWO of these criteria:
+1. The subreddit PRIMARILY consists of our EXACT target users (not just general users who might overlap)
+2. The subreddit FREQUENTLY has discussions DIRECTLY related to our specific problem area (market research, validation, product building)
+3. The subreddit's users would be IMMEDIATELY interested in our specific product type (AI market research tool)
+4. The subreddit EXPLICITLY focuses on topics like: startups, indie hacking, solopreneurs, product validation, marketing research
+</evaluation_criteria>
+
+<strict_instructions>
+- Use a HIGH bar (85+ on a 100-point scale) - only include subreddits with a DIRECT, OBVIOUS connection
+- Be EXTREMELY SUSPICIOUS of large subreddits (>1M subscribers) - they must have a very direct connection to be included
+- If a subreddit seems "maybe" relevant or "somewhat" relevant, REJECT IT
+- Only include subreddits that are a PERFECT FIT for our market and use case
+</strict_instructions>
+
+First, carefully analyze each subreddit in <thinking> tags to determine relevance.
+
+Then respond ONLY with a valid JSON object in the following format:
+
+<json_format>
+{
+  "relevant_subreddits": [
+    {
+      "name": "r/subredditname",
+      "relevance_score": 92,
+      "reason": "SPECIFIC evidence of direct relevance with clear examples of how this perfectly fits our market/product"
+    }
+  ],
+  "irrelevant_subreddits": [
+    {
+      "name": "r/subredditname",
+      "reason": "Brief explanation of why this isn't directly relevant enough"
+    }
+  ]
+}
+</json_format>
+
+Only include subreddits with a relevance score of 85 or higher in the relevant_subreddits list.
+
+Your response must begin with the opening curly brace of the JSON object and end with the closing curly brace, with no other text outside these braces.
+"""
+
+    return prefix, suffix
+
+class StreamingArrayParser:
+    """
+    Incrementally extract completed elements of a JSON array from a streamed response.
+    Elements are only yielded once fully received, so partial results are always valid.
+    """
+    def __init__(self, key):
+        # Match the key as an object member ("key": [), not the same word inside an earlier string value
+        self._key_pattern = re.compile(r'(?<!\\)"%s"\s*:\s*\[' % re.escape(key))
+        self._decoder = json.JSONDecoder()
+        self._chunks = []
+        self._buffer = ""
+        self._scan_from = 0
+        self._pos = None
+        self._done = False
+        self.items = []
+        
+    def feed(self, chunk):
+        """Add a chunk of response text and return any newly completed array elements."""
+        new_items = []
+        
+        if self._done:
+            return new_items
+        
+        # Consumed text is dropped below, so this join only covers the unparsed tail
+        self._chunks.append(chunk)
+        self._buffer = "".join(self._chunks)
+        
+        # Locate the opening bracket of the array once the key has arrived
+        if self._pos is None:
+            match = self._key_pattern.search(self._buffer, self._scan_from)
+            if match is None:
+                # A partial match can only start at one of the last two quotes
+                last_quote = self._buffer.rfind('"')
+                scan_from = max(self._buffer.rfind('"', 0, last_quote), 0) if last_quote > 0 else 0
+                # Drop text that can no longer match, keeping one character for the escape check
+                keep_from = max(scan_from - 1, 0)
+                self._buffer = self._buffer[keep_from:]
+                self._chunks = [self._buffer]
+                self._scan_from = scan_from - keep_from
+                return new_items
+            self._pos = match.end()
+        
+        while True:
+            pos = self._pos
+            while pos < len(self._buffer) and self._buffer[pos] in ' \t\r\n,':
+                pos += 1
+            self._pos = pos
+            
+            if pos >= len(self._buffer):
+                break
+            if self._buffer[pos] == ']':
+                self._done = True
+                break
+                
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                # Element not fully received yet
+                break
+                
+            self._pos = end
+            self.items.append(item)
+            new_items.append(item)
+        
+        # Keep only the unparsed tail for the next chunk
+        self._buffer = self._buffer[self._pos:]
+        self._chunks = [self._buffer]
+        self._pos = 0
+            
+        return new_items
+
 class SearchAgent:
+    # Default queries used when the AI query generation response can't be parsed
+    _FALLBACK_QUERIES = (
+        "marketing agency subreddits",
+        "reddit marketing automation tools",
+        "specialized marketing forums reddit",
+        "marketing directors reddit communities"
+    )
+    
+    # Maximum number of Reddit searches in flight at once
+    _SEARCH_CONCURRENCY = 6
+    
     def __init__(self, product_type, problem_area, target_audience, additional_context=None, search_mode="validation"):
         self.product_type = product_type
         self.problem_area = problem_area
@@ -74,12 +290,32 @@ class SearchAgent:
         self.max_iterations = 3
         self.min_iterations = 3  # Ensure at least 3 iterations run 
         self.all_search_results = []
+        self._seen_result_urls = set()  # URLs already in all_search_results
         self.found_subreddits = set()
         self.validated_subreddits = []
+        # Validated subreddits split by category, each kept sorted by subscribers (descending)
+        self._large, self._medium, self._niche = [], [], []
+        self._validated_name_set = set()  # Lowercased names of validated subreddits
+        self._valid_count = 0  # Always equals len(self.validated_subreddits) (kept in step by _add_validated_subreddits)
         self.subreddit_reasons = {}  # Store reasoning for each subreddit
+        self._think_cache = {}  # Evaluations keyed by a hash of the validated subreddit set
+        self._query_cache_owner = uuid.uuid4().hex  # Marks query cache entries made by this agent
         self.niche_threshold = 750000  # Adjusted: Subreddits with fewer subscribers than this are considered niche
         self.min_subscriber_threshold = 5000  # Adjusted: Minimum number of subscribers for a subreddit to be useful
         self.max_validations_per_iteration = 15  # Increased: Allow more validations per iteration
+        self.target_subreddit_count = 8  # Stop without asking the AI once this many are validated
+        
+        # Static parts of the screening prompt are shared across runs for the same product
+        self._screening_prefix, self._screening_suffix = _build_screening_prompt(
+            product_type, problem_area, target_audience, additional_context
+        )
+        
+        # Prompt template for think(), which only varies by search mode
+        self._think_template = self._build_think_template()
+        
+        # Shared HTTP connection pool for Reddit requests, created when a run starts
+        self._http = None
+        self._search_semaphore = None
         
         # Enhanced discovery settings
         self.use_enhanced_discovery = ENHANCED_DISCOVERY_AVAILABLE and self._should_use_enhanced_discovery()
@@ -88,12 +324,14 @@ class SearchAgent:
         self.callbacks = {
             "search_started": [],
             "query_executed": [],
+            "queries_partial": [],
             "search_results": [],
             "subreddit_found": [],
             "subreddit_validated": [],
             "iteration_started": [],
             "iteration_complete": [],
             "thinking_started": [],
+            "thinking_partial": [],
             "thinking_complete": [],
             "search_complete": [],
             "enhanced_discovery_started": [],
@@ -113,6 +351,46 @@ class SearchAgent:
             console.print(f"[yellow]Enhanced discovery requires at least 2 API keys. Available: {len(available_keys)}/3[/yellow]")
             return False
         
+    def _add_validated_subreddits(self, subreddits):
+        """Record newly validated subreddits and file each into its sorted category list."""
+        self.validated_subreddits.extend(subreddits)
+        self._valid_count += len(subreddits)
+        self._validated_name_set.update(
+            (sub.get('subreddit_name') or sub.get('name', '')).lower() for sub in subreddits
+        )
+        
+        for sub in subreddits:
+            sub_count = sub.get('subscribers', 0)
+            
+            # Use enhanced discovery category if available, otherwise use size-based categorization
+            category = sub.get('category') if sub.get('discovery_method') == 'enhanced_ai' else None
+            if category == 'primary':
+                target = self._large
+            elif category == 'secondary':
+                target = self._medium
+            elif category == 'niche':
+                target = self._niche
+            elif sub_count >= 1000000:  # Over 1M
+                target = self._large
+            elif sub_count >= self.niche_threshold:  # Over threshold but under 1M
+                target = self._medium
+            else:  # Under threshold
+                target = self._niche
+                
+            bisect.insort(target, sub, key=_by_subscribers_desc)
+        
+    def _create_http_session(self):
+        """Create a pooled aiohttp session so searches reuse connections and DNS lookups."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=16,
+                limit_per_host=6,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+        
     def register_callback(self, event_name, callback_fn):
         """Register a callback function for a specific event."""
         if event_name in self.callbacks:
@@ -261,9 +539,15 @@ class SearchAgent:
         console.print(f"[yellow]🔎 Searching web for:[/yellow] {query}")
         self.trigger_event("query_executed", {"query": query})
         
+        # Outside run() there is no shared pool yet: create the limiter on first use, and
+        # find_subreddits opens a temporary session when self._http is None
+        if self._search_semaphore is None:
+            self._search_semaphore = asyncio.Semaphore(self._SEARCH_CONCURRENCY)
+        
         try:
-            # Use the imported find_subreddits function 
-            subreddits = await find_subreddits(query)
+            # Use the imported find_subreddits function, limiting concurrent Reddit requests
+            async with self._search_semaphore:
+                subreddits = await find_subreddits(query, session=self._http)
             
             if not subreddits:
                 console.print("[yellow]No subreddits found[/yellow]")
@@ -316,13 +600,14 @@ class SearchAgent:
             else:
                 # Also look for subreddit mentions in the body
                 body = result.get('body', '')
-                content = title + " " + body
+                content = f"{title} {body}"
                 
-                # Find all subreddit mentions
-                matches = re.findall(r'r/[a-zA-Z0-9_]{3,21}', content.lower())
+                # Find all subreddit mentions (lowercase only the matched names)
+                matches = SUBREDDIT_MENTION_PATTERN.findall(content)
                 
                 # Count occurrences
                 for match in matches:
+                    match = match.lower()
                     if match in subreddit_mentions:
                         subreddit_mentions[match] += 1
                     else:
@@ -355,63 +640,7 @@ class SearchAgent:
         # Convert remaining list to comma-separated string for prompt
         subreddits_str = ", ".join(filtered_subreddits)
         
-        prompt = f"""
-You are a Reddit relevance expert with EXTREMELY HIGH STANDARDS for determining relevance to a specific product market. 
-Your task is to evaluate which subreddits from a given list are DIRECTLY relevant to our specific product/market niche. 
-Be EXTREMELY STRICT in your evaluations, rejecting anything that isn't a perfect fit.
-
-<product_information>
-- Product Type: {self.product_type}
-- Problem Area: {self.problem_area}
-- Target Audience: {self.target_audience}
-- Additional Context: {self.additional_context or "None provided"}
-</product_information>
-
-<subreddits_to_evaluate>
-{subreddits_str}
-</subreddits_to_evaluate>
-
-<evaluation_criteria>
-A subreddit is ONLY relevant if it meets AT LEAST TWO of these criteria:
-1. The subreddit PRIMARILY consists of our EXACT target users (not just general users who might overlap)
-2. The subreddit FREQUENTLY has discussions DIRECTLY related to our specific problem area (market research, validation, product building)
-3. The subreddit's users would be IMMEDIATELY interested in our specific product type (AI market research tool)
-4. The subreddit EXPLICITLY focuses on topics like: startups, indie hacking, solopreneurs, product validation, marketing research
-</evaluation_criteria>
-
-<strict_instructions>
-- Use a HIGH bar (85+ on a 100-point scale) - only include subreddits with a DIRECT, OBVIOUS connection
-- Be EXTREMELY SUSPICIOUS of large subreddits (>1M subscribers) - they must have a very direct connection to be included
-- If a subreddit seems "maybe" relevant or "somewhat" relevant, REJECT IT
-- Only include subreddits that are a PERFECT FIT for our market and use case
-</strict_instructions>
-
-First, carefully analyze each subreddit in <thinking> tags to determine relevance.
-
-Then respond ONLY with a valid JSON object in the following format:
-
-<json_format>
-{{
-  "relevant_subreddits": [
-    {{
-      "name": "r/subredditname",
-      "relevance_score": 92,
-      "reason": "SPECIFIC evidence of direct relevance with clear examples of how this perfectly fits our market/product"
-    }}
-  ],
-  "irrelevant_subreddits": [
-    {{
-      "name": "r/subredditname",
-      "reason": "Brief explanation of why this isn't directly relevant enough"
-    }}
-  ]
-}}
-</json_format>
-
-Only include subreddits with a relevance score of 85 or higher in the relevant_subreddits list.
-
-Your response must begin with the opening curly brace of the JSON object and end with the closing curly brace, with no other text outside these braces.
-"""
+        prompt = self._screening_prefix + subreddits_str + self._screening_suffix
 
         console.print(f"[yellow]🔍 Screening {len(filtered_subreddits)} subreddits for relevance...[/yellow]")
         self.trigger_event("screening_subreddits", {
@@ -427,7 +656,7 @@ Your response must begin with the opening curly brace of the JSON object and end
         )
         
         try:
-            parsed_response = json.loads(response)
+            parsed_response = _json_loads(response)
             relevant_subreddits = parsed_response.get("relevant_subreddits", [])
             irrelevant_subreddits = parsed_response.get("irrelevant_subreddits", [])
             
@@ -646,7 +875,7 @@ Your response must begin with the opening curly brace of the JSON object and end
         
         async def validate_with_semaphore(subreddit):
             async with semaphore:
-                metadata = await self.validate_subreddit_async(subreddit)
+                metadata = await self.validate_subreddit_async(subreddit, session=self._http)
                 if metadata:
                     validated.append(metadata)
                 
@@ -661,8 +890,13 @@ Your response must begin with the opening curly brace of the JSON object and end
         
         return validated
         
-    def make_ai_call(self, prompt, reason="unspecified", model="google/gemini-2.5-flash-preview"):
-        """Make an API call to OpenRouter."""
+    def make_ai_call(self, prompt, reason="unspecified", model="google/gemini-2.5-flash-preview", stream=False, on_delta=None):
+        """
+        Make an API call to OpenRouter.
+        
+        When stream is True the response is consumed as it arrives and each content
+        delta is passed to on_delta, so callers can act on partial output.
+        """
         global api_call_count
         api_call_count += 1
         
@@ -680,6 +914,9 @@ Your response must begin with the opening curly brace of the JSON object and end
         
         start_time = time.time()
         
+        # Ask for token usage in the final chunk when streaming
+        stream_kwargs = {"stream": True, "stream_options": {"include_usage": True}} if stream else {}
+        
         try:
             completion = client.chat.completions.create(
                 extra_headers={
@@ -693,18 +930,35 @@ Your response must begin with the opening curly brace of the JSON object and end
                         "content": prompt
                     }
                 ],
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                **stream_kwargs
             )
             
+            if stream:
+                content_parts = []
+                usage = None
+                for chunk in completion:
+                    if chunk.usage:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        content_parts.append(delta)
+                        if on_delta:
+                            on_delta(delta)
+                content = "".join(content_parts)
+            else:
+                usage = completion.usage
+                content = completion.choices[0].message.content
+            
             duration = time.time() - start_time
-            input_tokens = completion.usage.prompt_tokens
-            output_tokens = completion.usage.completion_tokens
+            input_tokens = usage.prompt_tokens if usage else 0
+            output_tokens = usage.completion_tokens if usage else 0
             
             console.print(f"[bold green]✅ API CALL COMPLETED (Run: {run_id}, Call: {call_id})[/bold green]")
             console.print(f"[dim]Duration: {duration:.2f}s, Input tokens: {input_tokens}, Output tokens: {output_tokens}[/dim]")
             
-            content = completion.choices[0].message.content
-            
             self.trigger_event("ai_call_completed", {
                 "call_id": call_id,
                 "duration": duration,
@@ -725,8 +979,87 @@ Your response must begin with the opening curly brace of the JSON object and end
             
             raise e
             
+    def _query_cache_signature(self, iteration, previous_results):
+        """
+        Build a text signature of the search state used to key the query cache.
+        The iteration number is left out so equivalent states match across runs; only
+        whether earlier results are in the prompt (iteration > 0) matters.
+        """
+        names = sorted(sub['subreddit_name'].lower() for sub in previous_results or []) if iteration > 0 else []
+        return (f"{self.search_mode} | {self.product_type} | {self.problem_area} | "
+                f"{self.target_audience} | {self.additional_context or ''} | {', '.join(names)}")
+    
+    def _embed_signature(self, signature):
+        """Embed a cache signature with the local model, or return None if unavailable."""
+        global _embedding_model
+        if not SEMANTIC_CACHE_AVAILABLE:
+            return None
+            
+        try:
+            if _embedding_model is None:
+                _embedding_model = SentenceTransformer(QUERY_CACHE_EMBEDDING_MODEL)
+            return _embedding_model.encode(signature, normalize_embeddings=True)
+        except Exception as e:
+            console.print(f"[yellow]Semantic query cache unavailable: {str(e)}[/yellow]")
+            return None
+    
+    def _lookup_cached_queries(self, signature):
+        """
+        Look up previously generated queries, first by exact signature and then by
+        embedding similarity. Returns (queries or None, signature embedding or None).
+        """
+        if _QUERY_CACHE_DISK is not None:
+            entry = _QUERY_CACHE_DISK.get(("queries", signature))
+        else:
+            entry = _QUERY_CACHE_EXACT.get(signature)
+        if entry is not None and entry[0] != self._query_cache_owner:
+            return entry[1], None
+            
+        vector = self._embed_signature(signature)
+        candidates = [(cached_vector, queries) for owner, cached_vector, queries in _QUERY_CACHE_SEMANTIC
+                      if owner != self._query_cache_owner]
+        if vector is None or not candidates:
+            return None, vector
+            
+        # Vectors are normalized, so a single matrix-vector product gives cosine similarities
+        similarities = np.vstack([cached_vector for cached_vector, _ in candidates]) @ vector
+        best_index = int(np.argmax(similarities))
+        if similarities[best_index] >= QUERY_CACHE_SIMILARITY_THRESHOLD:
+            return candidates[best_index][1], vector
+            
+        return None, vector
+    
+    def _store_cached_queries(self, signature, vector, queries):
+        """Store generated queries in both tiers of the query cache."""
+        entry = (self._query_cache_owner, list(queries))
+        if _QUERY_CACHE_DISK is not None:
+            _QUERY_CACHE_DISK.set(("queries", signature), entry, expire=QUERY_CACHE_TTL)
+        else:
+            _QUERY_CACHE_EXACT[signature] = entry
+        if vector is not None:
+            _QUERY_CACHE_SEMANTIC.append((self._query_cache_owner, vector, list(queries)))
+            del _QUERY_CACHE_SEMANTIC[:-QUERY_CACHE_SEMANTIC_MAX]
+            
+    def _concise_query(self, query):
+        """Limit a generated query to 7 words so searches stay focused."""
+        words = query.split()
+        if len(words) > 7:
+            query = " ".join(words[:7])
+        return query
+        
     def generate_search_queries(self, iteration=0, previous_results=None):
         """Generate search queries using AI based on the current state."""
+        # Skip the LLM call if we've already generated queries for an equivalent state
+        cache_signature = self._query_cache_signature(iteration, previous_results)
+        cached_queries, signature_vector = self._lookup_cached_queries(cache_signature)
+        if cached_queries is not None:
+            console.print("[cyan]Using cached search queries for similar search state[/cyan]")
+            self.trigger_event("queries_cache_hit", {
+                "iteration": iteration + 1,
+                "queries": cached_queries
+            })
+            return list(cached_queries)
+            
         context = f"""
 Product Type: {self.product_type}
 Problem Area: {self.problem_area}
@@ -817,26 +1150,33 @@ Your response should be a valid JSON object with this structure:
             "previous_results_count": len(previous_results) if previous_results else 0
         })
 
+        # Stream the response so each query is surfaced as soon as it completes
+        query_parser = StreamingArrayParser("search_queries")
+        
+        def on_delta(delta):
+            for query in query_parser.feed(delta):
+                self.trigger_event("queries_partial", {
+                    "iteration": iteration + 1,
+                    "query": self._concise_query(query),
+                    "queries": [self._concise_query(q) for q in query_parser.items]
+                })
+        
         # Make the API call
         response = self.make_ai_call(
             prompt=prompt,
             reason=f"Generate search queries for iteration {iteration + 1}",
-            model="google/gemini-2.5-flash-preview"
+            model="google/gemini-2.5-flash-preview",
+            stream=True,
+            on_delta=on_delta
         )
         
         try:
-            parsed_response = json.loads(response)
+            parsed_response = _json_loads(response)
             queries = parsed_response.get("search_queries", [])
             reasoning = parsed_response.get("reasoning", "No reasoning provided")
             
             # Ensure queries are concise by limiting length
-            concise_queries = []
-            for query in queries:
-                # Split query into words and limit to 7 words max
-                words = query.split()
-                if len(words) > 7:
-                    query = " ".join(words[:7])
-                concise_queries.append(query)
+            concise_queries = [self._concise_query(query) for query in queries]
             
             self.trigger_event("queries_generated", {
                 "iteration": iteration + 1,
@@ -844,6 +1184,8 @@ Your response should be a valid JSON object with this structure:
                 "reasoning": reasoning
             })
             
+            self._store_cached_queries(cache_signature, signature_vector, concise_queries)
+            
             return concise_queries
         except json.JSONDecodeError:
             console.print("[bold red]Error: AI response was not valid JSON[/bold red]")
@@ -854,13 +1196,20 @@ Your response should be a valid JSON object with this structure:
                 "error": "Invalid JSON response"
             })
             
+            # Keep any queries that completed before the response broke
+            if query_parser.items:
+                partial_queries = [self._concise_query(query) for query in query_parser.items]
+                
+                self.trigger_event("queries_generated", {
+                    "iteration": iteration + 1,
+                    "queries": partial_queries,
+                    "reasoning": "Recovered from a truncated response"
+                })
+                
+                return partial_queries
+            
             # Fallback to some default queries
-            fallback_queries = [
-                f"marketing agency subreddits",
-                f"reddit marketing automation tools",
-                f"specialized marketing forums reddit",
-                f"marketing directors reddit communities"
-            ]
+            fallback_queries = list(self._FALLBACK_QUERIES)
             
             self.trigger_event("using_fallback_queries", {
                 "iteration": iteration + 1,
@@ -869,47 +1218,13 @@ Your response should be a valid JSON object with this structure:
             
             return fallback_queries
             
-    def think(self, validated_subreddits):
-        """Evaluate search progress and determine next steps using AI."""
-        self.trigger_event("thinking_started", {
-            "validated_subreddits_count": len(validated_subreddits)
-        })
-        
-        # Count how many niche vs large subreddits we've found
-        niche_count = sum(1 for sub in validated_subreddits if self.min_subscriber_threshold <= sub.get('subscribers', 0) < self.niche_threshold)
-        large_count = sum(1 for sub in validated_subreddits if sub.get('subscribers', 0) >= self.niche_threshold)
-        
-        # Prepare context for the AI
-        context = f"""
-Product Type: {self.product_type}
-Problem Area: {self.problem_area}
-Target Audience: {self.target_audience}
-"""
-
-        # Add additional context differently based on search mode
-        if self.search_mode == "mvp":
-            context += f"""
-Question/Goal: {self.additional_context or "None provided"}
-"""
-        else:
-            context += f"""
-Additional Context: {self.additional_context or "None provided"}
-"""
-
-        context += f"""
-Search progress:
-- Total iterations completed: {self.search_iterations}
-- Total validated subreddits found: {len(validated_subreddits)}
-- Niche subreddits (2,500-{self.niche_threshold:,} subscribers): {niche_count}
-- Large subreddits (over {self.niche_threshold:,} subscribers): {large_count}
-"""
-
-        subreddit_info = ""
-        for sub in validated_subreddits:
-            subreddit_info += f"- {sub['subreddit_name']} ({sub.get('subscribers', 'Unknown')} subscribers): {sub.get('title', 'No title')}\n"
-        
+    def _build_think_template(self):
+        """
+        Build the think() prompt once per agent. The result is a format string with
+        {context} and {subreddit_info} placeholders filled in on each call.
+        """
         # Base prompt for both modes
-        base_prompt = f"""
+        base_prompt = """
 You are a Reddit community discovery expert.
 
 Current search state:
@@ -930,20 +1245,20 @@ Please analyze:
 
         # Custom prompt based on search mode
         if self.search_mode == "mvp":
-            custom_prompt = f"""
+            custom_prompt = """
 IMPORTANT: Focus on communities that can help answer the user's question or achieve their goal. Evaluate 
 how well each subreddit aligns with providing valuable insights, perspectives, or discussions that directly 
 relate to the question/goal the user has specified. Consider communities where people might be discussing 
 similar topics, challenges, or solutions.
 """
         else:
-            custom_prompt = f"""
+            custom_prompt = """
 IMPORTANT: Focus on communities that are DIRECTLY related to product validation, startup founders, marketing, 
 and copywriting. Do NOT include general technology subreddits (like r/Android, r/Apple) unless there is 
 strong evidence they discuss product development and validation frequently.
 """
 
-        prompt = base_prompt + custom_prompt + f"""
+        return base_prompt + custom_prompt + """
 Your response should be a valid JSON object with this structure:
 {{
   "evaluation": "Detailed analysis of search results quality",
@@ -958,16 +1273,86 @@ Your response should be a valid JSON object with this structure:
   ]
 }}
 """
+    
+    def think(self, validated_subreddits):
+        """Evaluate search progress and determine next steps using AI."""
+        # Reuse the previous evaluation if the validated set hasn't changed
+        cache_key = hashlib.blake2b(_json_dumps_sorted({
+            "subs": sorted(sub['subreddit_name'].lower() for sub in validated_subreddits),
+            "mode": self.search_mode,
+            "pt": self.product_type,
+            "pa": self.problem_area,
+            "ta": self.target_audience
+        }), digest_size=16).hexdigest()
+        
+        if cache_key in self._think_cache:
+            console.print("[cyan]Using cached evaluation for unchanged subreddit set[/cyan]")
+            self.trigger_event("thinking_cache_hit", {
+                "validated_subreddits_count": len(validated_subreddits)
+            })
+            return self._think_cache[cache_key]
+        
+        self.trigger_event("thinking_started", {
+            "validated_subreddits_count": len(validated_subreddits)
+        })
+        
+        # Count how many niche vs large subreddits we've found
+        niche_count = sum(1 for sub in validated_subreddits if self.min_subscriber_threshold <= sub.get('subscribers', 0) < self.niche_threshold)
+        large_count = sum(1 for sub in validated_subreddits if sub.get('subscribers', 0) >= self.niche_threshold)
+        
+        # Prepare context for the AI
+        context = f"""
+Product Type: {self.product_type}
+Problem Area: {self.problem_area}
+Target Audience: {self.target_audience}
+"""
+
+        # Add additional context differently based on search mode
+        if self.search_mode == "mvp":
+            context += f"""
+Question/Goal: {self.additional_context or "None provided"}
+"""
+        else:
+            context += f"""
+Additional Context: {self.additional_context or "None provided"}
+"""
+
+        context += f"""
+Search progress:
+- Total iterations completed: {self.search_iterations}
+- Total validated subreddits found: {len(validated_subreddits)}
+- Niche subreddits (2,500-{self.niche_threshold:,} subscribers): {niche_count}
+- Large subreddits (over {self.niche_threshold:,} subscribers): {large_count}
+"""
+
+        subreddit_info = "".join(
+            f"- {sub['subreddit_name']} ({sub.get('subscribers', 'Unknown')} subscribers): {sub.get('title', 'No title')}\n"
+            for sub in validated_subreddits
+        )
+        
+        prompt = self._think_template.format(context=context, subreddit_info=subreddit_info)
 
+        # Stream the response so recommendations are surfaced as soon as each one completes
+        recommendation_parser = StreamingArrayParser("top_recommendations")
+        
+        def on_delta(delta):
+            for recommendation in recommendation_parser.feed(delta):
+                self.trigger_event("thinking_partial", {
+                    "recommendation": recommendation,
+                    "top_recommendations": list(recommendation_parser.items)
+                })
+        
         # Make the API call
         response = self.make_ai_call(
             prompt=prompt,
             reason="Evaluate search progress and determine next steps",
-            model="google/gemini-2.5-flash-preview"
+            model="google/gemini-2.5-flash-preview",
+            stream=True,
+            on_delta=on_delta
         )
         
         try:
-            parsed_response = json.loads(response)
+            parsed_response = _json_loads(response)
             
             self.trigger_event("thinking_complete", {
                 "evaluation": parsed_response.get("evaluation", "No evaluation provided"),
@@ -977,6 +1362,8 @@ Your response should be a valid JSON object with this structure:
                 "top_recommendations": parsed_response.get("top_recommendations", [])
             })
             
+            self._think_cache[cache_key] = parsed_response
+            
             return parsed_response
         except json.JSONDecodeError:
             console.print("[bold red]Error: AI response was not valid JSON[/bold red]")
@@ -991,7 +1378,9 @@ Your response should be a valid JSON object with this structure:
                 "evaluation": "Unable to properly evaluate results",
                 "found_sufficient_communities": len(validated_subreddits) >= 6,
                 "continue_searching": len(validated_subreddits) < 6 and self.search_iterations < self.max_iterations,
-                "recommended_strategy": "Try more specific search terms"
+                "recommended_strategy": "Try more specific search terms",
+                # Keep any recommendations that completed before the response broke
+                "top_recommendations": recommendation_parser.items
             }
             
             self.trigger_event("using_fallback_thinking", default_response)
@@ -1002,6 +1391,14 @@ Your response should be a valid JSON object with this structure:
         """Run the search agent with an agentic loop."""
         console.print(f"\n[bold cyan]===== STARTING SEARCH AGENT RUN (ID: {run_id}) =====[/bold cyan]")
         
+        # Warm up the selection UI import in the background while the search runs.
+        # It is still imported after run() starts, so circular imports are avoided.
+        self._selection_import = asyncio.create_task(
+            asyncio.to_thread(importlib.import_module, "subreddit_selection")
+        )
+        # Runs that fail before selection never await the task; don't report its failure as unretrieved
+        self._selection_import.add_done_callback(_retrieve_task_exception)
+        
         self.trigger_event("search_started", {
             "run_id": run_id,
             "product_type": self.product_type,
@@ -1022,7 +1419,7 @@ Your response should be a valid JSON object with this structure:
                     console.print(f"[green]✓ Enhanced discovery successful! Found {len(enhanced_subreddits)} high-quality subreddits[/green]")
                     
                     # Add enhanced results to validated subreddits
-                    self.validated_subreddits.extend(enhanced_subreddits)
+                    self._add_validated_subreddits(enhanced_subreddits)
                     
                     # Check if enhanced discovery provided sufficient results
                     if len(enhanced_subreddits) >= 6:
@@ -1043,190 +1440,179 @@ Your response should be a valid JSON object with this structure:
             console.print("[yellow]Enhanced discovery not available, using traditional search[/yellow]")
             sufficient_results = False
         
-        while not sufficient_results and self.search_iterations < self.max_iterations:
-            console.print(f"\n[bold cyan]===== ITERATION {self.search_iterations + 1} =====[/bold cyan]")
-            
-            self.trigger_event("iteration_started", {
-                "iteration": self.search_iterations + 1,
-                "max_iterations": self.max_iterations
-            })
-            
-            # Generate search queries based on iteration
-            if self.search_iterations == 0:
-                # First iteration: use basic queries to establish a baseline
-                search_queries = [
-                    f"best subreddits for {self.product_type} founders",
-                    f"niche subreddits for {self.problem_area}",
-                    f"reddit communities specifically for {self.target_audience}",
-                    f"subreddits dedicated to {self.problem_area} for {self.target_audience}",
-                    f"specialized {self.product_type} subreddits under 100k",
-                    f"trending subreddits for {self.product_type} {self.problem_area}"
-                ]
+        # Share one connection pool across every search and validation in this run
+        self._http = self._create_http_session()
+        self._search_semaphore = asyncio.Semaphore(self._SEARCH_CONCURRENCY)
+        
+        try:
+            while not sufficient_results and self.search_iterations < self.max_iterations:
+                console.print(f"\n[bold cyan]===== ITERATION {self.search_iterations + 1} =====[/bold cyan]")
                 
-                self.trigger_event("using_default_queries", {
+                self.trigger_event("iteration_started", {
                     "iteration": self.search_iterations + 1,
-                    "queries": search_queries
+                    "max_iterations": self.max_iterations
                 })
-            else:
-                # Use AI to generate more targeted queries based on previous results
-                search_queries = self.generate_search_queries(
-                    iteration=self.search_iterations, 
-                    previous_results=self.validated_subreddits
-                )
-            
-            # Display generated queries
-            console.print(f"\n[bold cyan]Generated {len(search_queries)} search queries for this iteration[/bold cyan]")
-            for i, query in enumerate(search_queries):
-                console.print(f"  [bold]{i+1}.[/bold] {query}")
-            
-            # Perform searches in parallel using asyncio
-            iteration_results = []
-            tasks = [self.search_web(query) for query in search_queries]
-            search_results_list = await asyncio.gather(*tasks)
-            
-            # Flatten results from all queries
-            for results in search_results_list:
-                iteration_results.extend(results)
-                self.all_search_results.extend(results)
-            
-            # Extract and validate subreddits from this iteration's results
-            potential_subreddits = self.extract_subreddits_from_results(iteration_results)
-            console.print(f"\n[bold cyan]Found {len(potential_subreddits)} potential subreddits in this iteration[/bold cyan]")
-            
-            # Skip if no potential subreddits found
-            if not potential_subreddits:
-                console.print("[yellow]No potential subreddits found in this iteration. Continuing to next iteration.[/yellow]")
-                self.search_iterations += 1
-                continue
-            
-            self.trigger_event("potential_subreddits_found", {
-                "iteration": self.search_iterations + 1,
-                "count": len(potential_subreddits),
-                "subreddits": potential_subreddits
-            })
-            
-            # Screen subreddits for relevance before validation
-            relevant_subreddits = await self.screen_subreddits_for_relevance(potential_subreddits)
-            
-            # Skip if no relevant subreddits found
-            if not relevant_subreddits:
-                console.print("[yellow]No relevant subreddits found in this iteration. Continuing to next iteration.[/yellow]")
-                self.search_iterations += 1
-                continue
-            
-            # Only validate new subreddits we haven't validated before
-            already_validated = {sub['subreddit_name'].lower() for sub in self.validated_subreddits}
-            new_to_validate = [sub for sub in relevant_subreddits if sub.lower() not in already_validated]
-            
-            console.print(f"\n[bold cyan]Validating {len(new_to_validate)} new subreddits...[/bold cyan]")
-            
-            self.trigger_event("validation_started", {
-                "iteration": self.search_iterations + 1,
-                "count": len(new_to_validate),
-                "subreddits": new_to_validate
-            })
-            
-            # Validate subreddits in parallel
-            new_validated = await self.validate_subreddits(new_to_validate)
-            self.validated_subreddits.extend(new_validated)
-            
-            console.print(f"\n[bold green]Found {len(new_validated)} new valid subreddits in iteration {self.search_iterations + 1}[/bold green]")
-            
-            self.trigger_event("validation_complete", {
-                "iteration": self.search_iterations + 1,
-                "new_valid_count": len(new_validated),
-                "total_valid_count": len(self.validated_subreddits)
-            })
-            
-            # Use the "Think" function to evaluate progress and decide next steps
-            if len(self.validated_subreddits) > 0:
-                evaluation = self.think(self.validated_subreddits)
-                
-                console.print(f"\n[bold cyan]Evaluation of search progress:[/bold cyan]")
-                console.print(evaluation.get("evaluation", "No evaluation provided"))
-                
-                sufficient_results = evaluation.get("found_sufficient_communities", False)
-                should_continue = evaluation.get("continue_searching", True)
                 
-                # Enforce minimum iteration count
-                if sufficient_results and self.search_iterations + 1 < self.min_iterations:
-                    console.print("\n[bold yellow]🔄 Found sufficient communities, but enforcing minimum iteration count.[/bold yellow]")
-                    sufficient_results = False
-                    should_continue = True
+                # Generate search queries based on iteration
+                if self.search_iterations == 0:
+                    # First iteration: use basic queries to establish a baseline
+                    search_queries = [
+                        f"best subreddits for {self.product_type} founders",
+                        f"niche subreddits for {self.problem_area}",
+                        f"reddit communities specifically for {self.target_audience}",
+                        f"subreddits dedicated to {self.problem_area} for {self.target_audience}",
+                        f"specialized {self.product_type} subreddits under 100k",
+                        f"trending subreddits for {self.product_type} {self.problem_area}"
+                    ]
                     
-                if sufficient_results:
-                    console.print("\n[bold green]✅ Found sufficient communities! Ending search.[/bold green]")
-                    self.trigger_event("sufficient_results_found", {
+                    self.trigger_event("using_default_queries", {
                         "iteration": self.search_iterations + 1,
-                        "count": len(self.validated_subreddits)
+                        "queries": search_queries
                     })
-                    break
-                    
-                if not should_continue and self.search_iterations + 1 >= self.min_iterations:
-                    console.print("\n[bold yellow]🛑 AI suggests stopping the search. We have the best results we're likely to find.[/bold yellow]")
-                    self.trigger_event("search_stopping_early", {
+                else:
+                    # Use AI to generate more targeted queries based on previous results
+                    search_queries = self.generate_search_queries(
+                        iteration=self.search_iterations, 
+                        previous_results=self.validated_subreddits
+                    )
+                
+                # Display generated queries
+                console.print(f"\n[bold cyan]Generated {len(search_queries)} search queries for this iteration[/bold cyan]")
+                for i, query in enumerate(search_queries):
+                    console.print(f"  [bold]{i+1}.[/bold] {query}")
+                
+                # Perform searches in parallel using asyncio; gather keeps query order so ranking ties are stable
+                query_results = await asyncio.gather(*(self.search_web(query) for query in search_queries))
+                
+                # Every hit counts toward this iteration's mention ranking; only the
+                # run-wide history is deduplicated by URL
+                iteration_results = []
+                for results in query_results:
+                    for result in results:
+                        iteration_results.append(result)
+                        url = result.get("href")
+                        if url and url not in self._seen_result_urls:
+                            self._seen_result_urls.add(url)
+                            self.all_search_results.append(result)
+                
+                # Extract and validate subreddits from this iteration's results
+                potential_subreddits = self.extract_subreddits_from_results(iteration_results)
+                console.print(f"\n[bold cyan]Found {len(potential_subreddits)} potential subreddits in this iteration[/bold cyan]")
+                
+                # Skip if no potential subreddits found
+                if not potential_subreddits:
+                    console.print("[yellow]No potential subreddits found in this iteration. Continuing to next iteration.[/yellow]")
+                    self.search_iterations += 1
+                    continue
+                
+                self.trigger_event("potential_subreddits_found", {
+                    "iteration": self.search_iterations + 1,
+                    "count": len(potential_subreddits),
+                    "subreddits": potential_subreddits
+                })
+                
+                # Screen subreddits for relevance before validation
+                relevant_subreddits = await self.screen_subreddits_for_relevance(potential_subreddits)
+                
+                # Skip if no relevant subreddits found
+                if not relevant_subreddits:
+                    console.print("[yellow]No relevant subreddits found in this iteration. Continuing to next iteration.[/yellow]")
+                    self.search_iterations += 1
+                    continue
+                
+                # Only validate new subreddits we haven't validated before
+                new_to_validate = [sub for sub in relevant_subreddits if sub.lower() not in self._validated_name_set]
+                
+                console.print(f"\n[bold cyan]Validating {len(new_to_validate)} new subreddits...[/bold cyan]")
+                
+                self.trigger_event("validation_started", {
+                    "iteration": self.search_iterations + 1,
+                    "count": len(new_to_validate),
+                    "subreddits": new_to_validate
+                })
+                
+                # Validate subreddits in parallel
+                new_validated = await self.validate_subreddits(new_to_validate)
+                self._add_validated_subreddits(new_validated)
+                
+                console.print(f"\n[bold green]Found {len(new_validated)} new valid subreddits in iteration {self.search_iterations + 1}[/bold green]")
+                
+                self.trigger_event("validation_complete", {
+                    "iteration": self.search_iterations + 1,
+                    "new_valid_count": len(new_validated),
+                    "total_valid_count": self._valid_count
+                })
+                
+                # Skip the AI evaluation when we already have enough subreddits and have met the minimum iterations
+                if self._valid_count >= self.target_subreddit_count and self.search_iterations + 1 >= self.min_iterations:
+                    console.print("\n[bold green]✅ Found enough communities! Ending search.[/bold green]")
+                    sufficient_results = True
+                    self.trigger_event("sufficient_results_shortcircuit", {
                         "iteration": self.search_iterations + 1,
-                        "reason": "AI recommendation",
-                        "evaluation": evaluation.get("evaluation", "No evaluation provided")
+                        "count": self._valid_count,
+                        "target": self.target_subreddit_count
                     })
                     break
-                elif not should_continue:
-                    console.print("\n[bold yellow]🔄 AI suggests stopping, but enforcing minimum iteration count.[/bold yellow]")
+                
+                # Use the "Think" function to evaluate progress and decide next steps
+                if self._valid_count > 0:
+                    evaluation = self.think(self.validated_subreddits)
                     
-                console.print(f"\n[bold cyan]Strategy for next iteration:[/bold cyan] {evaluation.get('recommended_strategy', 'No strategy provided')}")
-            
-            # Increment iteration counter
-            self.search_iterations += 1
+                    console.print(f"\n[bold cyan]Evaluation of search progress:[/bold cyan]")
+                    console.print(evaluation.get("evaluation", "No evaluation provided"))
+                    
+                    sufficient_results = evaluation.get("found_sufficient_communities", False)
+                    should_continue = evaluation.get("continue_searching", True)
+                    
+                    # Enforce minimum iteration count
+                    if sufficient_results and self.search_iterations + 1 < self.min_iterations:
+                        console.print("\n[bold yellow]🔄 Found sufficient communities, but enforcing minimum iteration count.[/bold yellow]")
+                        sufficient_results = False
+                        should_continue = True
+                        
+                    if sufficient_results:
+                        console.print("\n[bold green]✅ Found sufficient communities! Ending search.[/bold green]")
+                        self.trigger_event("sufficient_results_found", {
+                            "iteration": self.search_iterations + 1,
+                            "count": self._valid_count
+                        })
+                        break
+                        
+                    if not should_continue and self.search_iterations + 1 >= self.min_iterations:
+                        console.print("\n[bold yellow]🛑 AI suggests stopping the search. We have the best results we're likely to find.[/bold yellow]")
+                        self.trigger_event("search_stopping_early", {
+                            "iteration": self.search_iterations + 1,
+                            "reason": "AI recommendation",
+                            "evaluation": evaluation.get("evaluation", "No evaluation provided")
+                        })
+                        break
+                    elif not should_continue:
+                        console.print("\n[bold yellow]🔄 AI suggests stopping, but enforcing minimum iteration count.[/bold yellow]")
+                        
+                    console.print(f"\n[bold cyan]Strategy for next iteration:[/bold cyan] {evaluation.get('recommended_strategy', 'No strategy provided')}")
+                
+                # Increment iteration counter
+                self.search_iterations += 1
+                
+                self.trigger_event("iteration_complete", {
+                    "iteration": self.search_iterations,
+                    "new_valid_subreddits": len(new_validated),
+                    "total_valid_subreddits": self._valid_count,
+                    "continue": not sufficient_results and self.search_iterations < self.max_iterations
+                })
             
-            self.trigger_event("iteration_complete", {
-                "iteration": self.search_iterations,
-                "new_valid_subreddits": len(new_validated),
-                "total_valid_subreddits": len(self.validated_subreddits),
-                "continue": not sufficient_results and self.search_iterations < self.max_iterations
-            })
+        finally:
+            await self._http.close()
+            self._http = None
         
         # Search complete - prepare categorized results
         console.print(f"\n[bold green]===== SEARCH COMPLETE ({self.search_iterations} iterations) =====[/bold green]")
-        console.print(f"[bold green]Found {len(self.validated_subreddits)} validated subreddits[/bold green]")
+        console.print(f"[bold green]Found {self._valid_count} validated subreddits[/bold green]")
         
-        # Categorize subreddits by size and enhanced discovery categories
-        large_subreddits = []
-        medium_subreddits = []
-        niche_subreddits = []
-        
-        for sub in self.validated_subreddits:
-            sub_count = sub.get('subscribers', 0)
-            
-            # Use enhanced discovery category if available, otherwise use size-based categorization
-            if sub.get('discovery_method') == 'enhanced_ai' and sub.get('category'):
-                enhanced_category = sub.get('category')
-                if enhanced_category == 'primary':
-                    large_subreddits.append(sub)
-                elif enhanced_category == 'secondary':
-                    medium_subreddits.append(sub)
-                elif enhanced_category == 'niche':
-                    niche_subreddits.append(sub)
-                else:
-                    # Fallback to size-based categorization
-                    if sub_count >= 1000000:  # Over 1M
-                        large_subreddits.append(sub)
-                    elif sub_count >= self.niche_threshold:  # Over threshold but under 1M
-                        medium_subreddits.append(sub)
-                    else:  # Under threshold
-                        niche_subreddits.append(sub)
-            else:
-                # Traditional size-based categorization
-                if sub_count >= 1000000:  # Over 1M
-                    large_subreddits.append(sub)
-                elif sub_count >= self.niche_threshold:  # Over threshold but under 1M
-                    medium_subreddits.append(sub)
-                else:  # Under threshold
-                    niche_subreddits.append(sub)
-                
-        # Sort each category by subscriber count
-        large_subreddits.sort(key=lambda x: x.get('subscribers', 0), reverse=True)
-        medium_subreddits.sort(key=lambda x: x.get('subscribers', 0), reverse=True)
-        niche_subreddits.sort(key=lambda x: x.get('subscribers', 0), reverse=True)
+        # Subreddits were categorized and sorted as they were validated
+        large_subreddits = self._large
+        medium_subreddits = self._medium
+        niche_subreddits = self._niche
         
         # Print the categorized results - simplified output
         console.print(f"\n[bold cyan]===== SUBREDDIT RECOMMENDATIONS =====[/bold cyan]")
@@ -1239,43 +1625,24 @@ Your response should be a valid JSON object with this structure:
         table.add_column("Source", style="green")
         table.add_column("Description")
         
-        # Add large subreddits
-        if large_subreddits:
-            console.print(f"\n[bold yellow]PRIMARY COMMUNITIES ({len(large_subreddits)})[/bold yellow]")
-            for sub in large_subreddits:
-                source = "Enhanced AI" if sub.get('discovery_method') == 'enhanced_ai' else "Traditional"
-                table.add_row(
-                    sub.get('subreddit_name', sub.get('name', '')),
-                    f"{sub.get('subscribers', 0):,}",
-                    "Primary",
-                    source,
-                    sub.get('title', sub.get('description', 'No description'))[:50] + ('...' if len(sub.get('title', sub.get('description', ''))) > 50 else '')
-                )
-                
-        # Add medium subreddits
-        if medium_subreddits:
-            console.print(f"\n[bold green]SECONDARY COMMUNITIES ({len(medium_subreddits)})[/bold green]")
-            for sub in medium_subreddits:
-                source = "Enhanced AI" if sub.get('discovery_method') == 'enhanced_ai' else "Traditional"
-                table.add_row(
-                    sub.get('subreddit_name', sub.get('name', '')),
-                    f"{sub.get('subscribers', 0):,}",
-                    "Secondary",
-                    source,
-                    sub.get('title', sub.get('description', 'No description'))[:50] + ('...' if len(sub.get('title', sub.get('description', ''))) > 50 else '')
-                )
+        # Add each category's subreddits to the table
+        for category_subreddits, category_label, header_color in (
+            (large_subreddits, "Primary", "yellow"),
+            (medium_subreddits, "Secondary", "green"),
+            (niche_subreddits, "Niche", "cyan")
+        ):
+            if not category_subreddits:
+                continue
                 
-        # Add niche subreddits
-        if niche_subreddits:
-            console.print(f"\n[bold cyan]NICHE COMMUNITIES ({len(niche_subreddits)})[/bold cyan]")
-            for sub in niche_subreddits:
+            console.print(f"\n[bold {header_color}]{category_label.upper()} COMMUNITIES ({len(category_subreddits)})[/bold {header_color}]")
+            for sub in category_subreddits:
                 source = "Enhanced AI" if sub.get('discovery_method') == 'enhanced_ai' else "Traditional"
                 table.add_row(
                     sub.get('subreddit_name', sub.get('name', '')),
                     f"{sub.get('subscribers', 0):,}",
-                    "Niche",
+                    category_label,
                     source,
-                    sub.get('title', sub.get('description', 'No description'))[:50] + ('...' if len(sub.get('title', sub.get('description', ''))) > 50 else '')
+                    self._trim_title(sub)
                 )
         
         # Display the table
@@ -1288,7 +1655,7 @@ Your response should be a valid JSON object with this structure:
         result = {
             "run_id": run_id,
             "iterations": self.search_iterations,
-            "total_valid_subreddits": len(self.validated_subreddits),
+            "total_valid_subreddits": self._valid_count,
             "api_calls": api_call_count,
             "categories": {
                 "large_communities": [self._format_subreddit_for_output(sub) for sub in large_subreddits],
@@ -1300,12 +1667,19 @@ Your response should be a valid JSON object with this structure:
         
         self.trigger_event("search_complete", result)
         
-        # Ask if the user wants to select subreddits for analysis
-        console.print("\n[bold cyan]Would you like to select subreddits for analysis?[/bold cyan]")
-        should_select = Prompt.ask("Select subreddits now?", choices=["y", "n"], default="y")
+        # Ask if the user wants to select subreddits for analysis (always yes in
+        # non-interactive REDDIT_AGENT_AUTO=1 runs, which select without prompting)
+        if os.getenv("REDDIT_AGENT_AUTO") == "1":
+            should_select = "y"
+        else:
+            console.print("\n[bold cyan]Would you like to select subreddits for analysis?[/bold cyan]")
+            should_select = Prompt.ask("Select subreddits now?", choices=["y", "n"], default="y")
         
-        if should_select.lower() == "y":
+        if should_select.lower() != "y":
+            self._selection_import.cancel()
+        else:
             # Import the subreddit_selection module here to avoid circular imports
+            await self._selection_import
             from subreddit_selection import select_subreddits_for_analysis
             
             try:
@@ -1335,21 +1709,27 @@ Your response should be a valid JSON object with this structure:
         
         return result
         
+    def _trim_title(self, sub, max_length=50):
+        """Shorten a subreddit's title (or description) for table display."""
+        title = sub.get('title', sub.get('description', 'No description'))
+        return title if len(title) <= max_length else title[:max_length] + '...'
+        
     def _format_subreddit_for_output(self, subreddit_data):
         """Format subreddit data for output, with cleaner structure"""
         # Handle both traditional and enhanced discovery formats
         name = subreddit_data.get('subreddit_name') or subreddit_data.get('name', '')
         title = subreddit_data.get('title') or subreddit_data.get('description', '')
         description = subreddit_data.get('public_description') or subreddit_data.get('description', '')
+        subscribers = subreddit_data.get('subscribers', 0)
         
         formatted = {
             "name": name,
             "title": title,
-            "subscribers": subreddit_data.get('subscribers', 0),
+            "subscribers": subscribers,
             "description": description,
             "url": subreddit_data.get('url', ''),
             "created_utc": subreddit_data.get('created_utc', 0),
-            "is_niche": subreddit_data.get('subscribers', 0) < self.niche_threshold,
+            "is_niche": subscribers < self.niche_threshold,
             "active_users": subreddit_data.get('active_user_count', 0),
             "selection_reason": subreddit_data.get('selection_reason', "Relevant community for market research")
         }
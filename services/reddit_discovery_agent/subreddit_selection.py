@@ -1,27 +1,103 @@
 import os
+import sys
 import json
+import logging
+import itertools
+import functools
+import concurrent.futures
+from heapq import nlargest
+from operator import itemgetter
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Union, Optional
 from rich.console import Console
-from rich.prompt import Prompt
-from rich.panel import Panel
-from prompt_toolkit import Application
-from prompt_toolkit.layout import Layout, HSplit, VSplit
-from prompt_toolkit.widgets import Frame, Label, Box
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.styles import Style
-from prompt_toolkit.formatted_text import HTML
-from subreddit_utils import get_subreddit_info
+from subreddit_utils import get_subreddits_info_bulk, normalize_subreddit, is_valid_subreddit_name
+from dotenv import load_dotenv
+
+# Use orjson for payload serialization when available
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+    def _json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    def _json_dumps_pretty(obj):
+        return json.dumps(obj, indent=2)
 
 # Setup console for better output
 console = Console()
 
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Load environment variables once and resolve the Gumloop settings at import
+load_dotenv()
+GUMLOOP_API_URL = "https://api.gumloop.com/api/v1/start_pipeline"
+_GUMLOOP_USER_ID = os.getenv("GUMLOOP_USER_ID", "EZUCg1VIYohJJgKgwDTrTyH2sC32")
+_GUMLOOP_SAVED_ITEM_ID = os.getenv("GUMLOOP_SAVED_ITEM_ID", "aoq3DjMNT9hRP3JMHfosBT")
+_GUMLOOP_API_KEY = os.getenv("GUMLOOP_API_KEY")
+
+if not _GUMLOOP_API_KEY:
+    logger.warning("GUMLOOP_API_KEY is not set; sending to the Gumloop API will be unavailable")
+
+# Shared keep-alive session for Gumloop API calls
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+# POST is not in Retry's default allowed methods, so only connection failures are retried
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# Maximum number of subreddits offered in the interactive selector
+DISPLAY_CAP = 50
+
+# Number of subreddits taken in non-interactive (auto-select) mode
+AUTO_SELECT_COUNT = 8
+
+# Answers used instead of prompts in non-interactive mode; sending defaults to a
+# dry "test" run so CI never posts to Gumloop unless REDDIT_AGENT_SEND=y
+AUTO_EMAIL = os.getenv("REDDIT_AGENT_EMAIL", "")
+AUTO_POST_LIMIT = os.getenv("REDDIT_AGENT_POST_LIMIT", "75")
+AUTO_SEND = os.getenv("REDDIT_AGENT_SEND", "test")
+
+# Gumloop pipeline inputs in the order the pipeline expects, with their defaults
+_PIPELINE_TEMPLATE = (
+    ("email", ""),
+    ("subscribers", ""),
+    ("post_limit", "75"),
+    ("name", ""),
+    ("subreddits", ""),
+    ("audience", ""),
+    ("problem_area", ""),
+    ("product_type", ""),
+    ("features", ""),
+    ("value_prop", ""),
+    ("context", ""),
+    ("run_id", ""),  # run_id for attribution
+)
+
+# (connect, read) timeouts for the webhook request
+WEBHOOK_TIMEOUT = (3.05, 30)
+
+# Background worker so the webhook POST doesn't block the console while it's in flight
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="gumloop-webhook")
+
 def select_subreddits_for_analysis(
     result: Dict[str, Any], 
     target_audience: str,
     problem_area: str, 
     product_type: str,
-    additional_context: Optional[str] = None
+    additional_context: Optional[str] = None,
+    auto_select: Optional[int] = None
 ) -> Union[List[Dict[str, Any]], bool]:
     """
     Interactive UI to select subreddits for further analysis.
@@ -32,38 +108,48 @@ def select_subreddits_for_analysis(
         problem_area: The problem area the product addresses
         product_type: The type of product
         additional_context: Any additional context about the product
+        auto_select: If set, run without prompts: take this many of the largest
+            subreddits and answer the webhook prompts from REDDIT_AGENT_EMAIL,
+            REDDIT_AGENT_POST_LIMIT and REDDIT_AGENT_SEND (also enabled with
+            REDDIT_AGENT_AUTO=1)
         
     Returns:
         List of selected subreddits or False if operation was cancelled
     """
+    from rich.prompt import Prompt
+    
+    if auto_select is None and os.getenv("REDDIT_AGENT_AUTO") == "1":
+        auto_select = AUTO_SELECT_COUNT
+    
     console.print("\n[bold cyan]===== SELECT SUBREDDITS FOR ANALYSIS =====[/bold cyan]")
-    console.print("[yellow]Creating interactive selection interface...[/yellow]")
     
     # Combine all categories into a single list for selection
-    all_subreddits = []
     categories = result["categories"]
+    all_subreddits = itertools.chain.from_iterable(categories.values())
     
-    for category, subs in categories.items():
-        for sub in subs:
-            all_subreddits.append(sub)
+    # Keep the largest subreddits by subscriber count (descending)
+    all_subreddits = nlargest(DISPLAY_CAP, all_subreddits, key=itemgetter("subscribers"))
     
-    # Sort by subscriber count (descending)
-    all_subreddits.sort(key=lambda x: x["subscribers"], reverse=True)
-    
-    # Create interactive interface using prompt_toolkit
-    selected_subreddits = interactive_subreddit_selector(all_subreddits)
+    if auto_select is not None:
+        # Non-interactive runs just take the top subreddits by subscriber count
+        selected_subreddits = all_subreddits[:auto_select]
+    else:
+        # Create interactive interface using prompt_toolkit
+        console.print("[yellow]Creating interactive selection interface...[/yellow]")
+        selected_subreddits = interactive_subreddit_selector(all_subreddits)
     
     if not selected_subreddits:
         console.print("[yellow]No subreddits selected. Exiting.[/yellow]")
         return []
     
-    console.clear()
+    if auto_select is None:
+        console.clear()
     console.print("[bold green]Selected Subreddits:[/bold green]")
     for sub in selected_subreddits:
         console.print(f"  • {sub['name']} ({sub['subscribers']:,} subscribers)")
     
     # Ask if user wants to add additional subreddits
-    add_more = Prompt.ask(
+    add_more = "n" if auto_select is not None else Prompt.ask(
         "\n[bold cyan]Would you like to add any additional subreddits that weren't found in the search?[/bold cyan]",
         choices=["y", "n"],
         default="n"
@@ -83,7 +169,8 @@ def select_subreddits_for_analysis(
         target_audience,
         problem_area,
         product_type,
-        additional_context
+        additional_context,
+        interactive=auto_select is None
     )
 
 def add_additional_subreddits() -> List[Dict[str, Any]]:
@@ -93,7 +180,11 @@ def add_additional_subreddits() -> List[Dict[str, Any]]:
     Returns:
         List of validated additional subreddit dictionaries
     """
+    from rich.prompt import Prompt
+    from rich.panel import Panel
+    
     additional_subreddits = []
+    seen_names: set[str] = set()
     
     console.print(Panel.fit(
         "[bold]Add Additional Subreddits[/bold]\n\n"
@@ -120,24 +211,29 @@ def add_additional_subreddits() -> List[Dict[str, Any]]:
             
         console.print(f"\n[yellow]Validating {len(subreddit_names)} subreddit(s)...[/yellow]")
         
+        # Look up every entered subreddit in a single request
+        subreddit_infos = get_subreddits_info_bulk(subreddit_names)
+        
+        # Collect per-subreddit results and print them together after the loop
+        messages = []
+        
         # Validate each subreddit
         for subreddit_name in subreddit_names:
             # Clean the subreddit name
-            clean_name = subreddit_name.lower().strip()
-            if clean_name.startswith('r/'):
-                clean_name = clean_name[2:]
-            elif clean_name.startswith('/r/'):
-                clean_name = clean_name[3:]
+            clean_name = normalize_subreddit(subreddit_name)
             
             # Skip if already in the list
-            if any(sub['name'].lower() == f"r/{clean_name}" for sub in additional_subreddits):
-                console.print(f"[yellow]⚠️ {clean_name} already added, skipping[/yellow]")
+            if f"r/{clean_name}" in seen_names:
+                messages.append(f"[yellow]⚠️ {clean_name} already added, skipping[/yellow]")
+                continue
+            
+            # Reject names Reddit could never accept without a lookup
+            if not is_valid_subreddit_name(clean_name):
+                messages.append(f"[red]✗ Invalid name[/red] {subreddit_name} - subreddit names are 2-21 letters, numbers or underscores")
                 continue
-                
-            console.print(f"[yellow]Checking[/yellow] r/{clean_name}...")
             
             # Get subreddit info
-            info = get_subreddit_info(clean_name)
+            info = subreddit_infos.get(clean_name)
             
             if info:
                 # Successfully validated
@@ -158,18 +254,23 @@ def add_additional_subreddits() -> List[Dict[str, Any]]:
                 
                 # Check minimum threshold (lower threshold for manually added subreddits)
                 if subscriber_count < 1500:
-                    console.print(f"[yellow]✓ Validated but too small[/yellow] r/{clean_name} - {subscriber_count:,} subscribers (minimum 1,500)")
+                    messages.append(f"[yellow]✓ Validated but too small[/yellow] r/{clean_name} - {subscriber_count:,} subscribers (minimum 1,500)")
                     continue
                     
                 additional_subreddits.append(metadata)
-                console.print(f"[green]✓ Added[/green] r/{clean_name} - {subscriber_count:,} subscribers")
+                seen_names.add(metadata['name'].lower())
+                messages.append(f"[green]✓ Added[/green] r/{clean_name} - {subscriber_count:,} subscribers")
             else:
-                console.print(f"[red]✗ Could not validate[/red] r/{clean_name} - subreddit may not exist or be private")
+                messages.append(f"[red]✗ Could not validate[/red] r/{clean_name} - subreddit may not exist or be private")
+        
+        if messages:
+            console.print("\n".join(messages))
         
         if additional_subreddits:
             console.print(f"\n[bold green]Added {len(additional_subreddits)} additional subreddit(s):[/bold green]")
-            for sub in additional_subreddits:
-                console.print(f"  • {sub['name']} ({sub['subscribers']:,} subscribers)")
+            console.print("\n".join(
+                f"  • {sub['name']} ({sub['subscribers']:,} subscribers)" for sub in additional_subreddits
+            ))
         
         # Ask if they want to add more
         add_more = Prompt.ask(
@@ -193,15 +294,29 @@ def interactive_subreddit_selector(subreddits: List[Dict[str, Any]]) -> List[Dic
     Returns:
         List of selected subreddits
     """
+    # Imported here so auto-select and non-UI callers never load prompt_toolkit
+    from prompt_toolkit import Application
+    from prompt_toolkit.application import get_app
+    from prompt_toolkit.layout import Layout, HSplit, Window, FormattedTextControl
+    from prompt_toolkit.widgets import Frame, Label
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.styles import Style
+    
     # Add a max limit of 8 selections
     max_selections = 8
     
     # Track selection state
-    selected_indices = []
+    selected_indices: set[int] = set()
     current_index = 0
     
-    # List to hold the Label widgets
-    subreddit_labels = []
+    # First row shown in the viewport; only visible rows are rendered
+    scroll_top = 0
+    
+    # Rows taken by the frame border, header, help text, counter and status line
+    layout_overhead = 6
+    
+    def visible_rows():
+        return max(1, get_app().output.get_size().rows - layout_overhead)
     
     # Define key bindings
     kb = KeyBindings()
@@ -212,29 +327,32 @@ def interactive_subreddit_selector(subreddits: List[Dict[str, Any]]) -> List[Dic
     
     @kb.add('up')
     def _(event):
-        nonlocal current_index
+        nonlocal current_index, scroll_top
         current_index = max(0, current_index - 1)
-        update_labels()
+        scroll_top = min(scroll_top, current_index)
+        event.app.invalidate()
     
     @kb.add('down')
     def _(event):
-        nonlocal current_index
+        nonlocal current_index, scroll_top
         current_index = min(len(subreddits) - 1, current_index + 1)
-        update_labels()
+        scroll_top = max(scroll_top, current_index - visible_rows() + 1)
+        event.app.invalidate()
     
     @kb.add('enter')
     def _(event):
         nonlocal selected_indices
         if current_index in selected_indices:
-            selected_indices.remove(current_index)
+            selected_indices.discard(current_index)
         elif len(selected_indices) < max_selections:
-            selected_indices.append(current_index)
-        update_labels()
+            selected_indices.add(current_index)
+        update_selection_count()
+        event.app.invalidate()
     
     @kb.add('s')
     def _(event):
         if selected_indices:
-            event.app.exit(result=selected_indices)
+            event.app.exit(result=sorted(selected_indices))
         else:
             update_status_label("Please select at least one subreddit")
     
@@ -248,43 +366,57 @@ def interactive_subreddit_selector(subreddits: List[Dict[str, Any]]) -> List[Dic
     def update_selection_count():
         selection_count_label.text = f"Selected: {len(selected_indices)}/{max_selections}"
     
-    # Create labels for each subreddit
-    for _ in subreddits:
-        subreddit_labels.append(Label(text=""))
-    
-    def update_labels():
-        for i, sub in enumerate(subreddits):
-            # Format the subreddit text
-            subscriber_count = f"{sub['subscribers']:,}"
-            is_selected = i in selected_indices
-            is_current = i == current_index
-            
-            # Create the display text
-            if is_selected:
-                marker = "[x]"
-                style = "fg:green"
-            else:
-                marker = "[ ]"
-                style = ""
-            
-            # Highlight current selection
-            if is_current:
-                style = "reverse"
-            
-            text = f"{marker} {sub['name']} ({subscriber_count} subscribers)"
-            subreddit_labels[i].text = HTML(f"<{style}>{text}</{style}>") if style else text
+    # Names and subscriber counts never change, so format each row once up front
+    formatted_rows = [f"{sub['name']} ({sub['subscribers']:,} subscribers)" for sub in subreddits]
+    # Rows carry their own leading space instead of a padded container
+    unselected_rows = [f" [ ] {row}\n" for row in formatted_rows]
+    selected_rows = [f" [x] {row}\n" for row in formatted_rows]
+    
+    # Row state bits for render_row
+    ROW_CURRENT = 1
+    ROW_SELECTED = 2
+    
+    @functools.lru_cache(maxsize=len(subreddits) * 4)
+    def render_row(i, state):
+        """Return the (style, text) fragment for a subreddit row in the given state."""
+        # Create the display text
+        if state & ROW_SELECTED:
+            text = selected_rows[i]
+            style = "class:selected"
+        else:
+            text = unselected_rows[i]
+            style = ""
         
-        update_selection_count()
+        # Highlight current selection
+        if state & ROW_CURRENT:
+            style = "reverse"
+        
+        return (style, text)
+    
+    def get_fragments():
+        """Render the rows inside the viewport as one fragment list."""
+        bottom = min(len(subreddits), scroll_top + visible_rows())
+        return [
+            render_row(
+                i,
+                (ROW_CURRENT if i == current_index else 0)
+                | (ROW_SELECTED if i in selected_indices else 0)
+            )
+            for i in range(scroll_top, bottom)
+        ]
     
     # Initial update
-    update_labels()
+    update_selection_count()
     
     # Create the layout
-    header = Label(text=HTML("<b>Select Subreddits for Analysis</b>"))
+    header = Label(text=[("bold", "Select Subreddits for Analysis")])
     help_text = Label(text="Select up to 8 subreddits for analysis")
     
     # Create a container for scrollable content
-    content_box = HSplit(subreddit_labels)
+    content_box = Window(
+        content=FormattedTextControl(text=get_fragments, focusable=True),
+        wrap_lines=False
+    )
     
     # Main layout
     root_container = Frame(
@@ -292,7 +424,7 @@ def interactive_subreddit_selector(subreddits: List[Dict[str, Any]]) -> List[Dic
             header,
             help_text,
             selection_count_label,
-            Box(content_box, padding=1),
+            content_box,
             status_label
         ])
     )
@@ -301,6 +433,7 @@ def interactive_subreddit_selector(subreddits: List[Dict[str, Any]]) -> List[Dic
     style = Style.from_dict({
         'frame.border': '#00FFFF',
         'frame.label': 'bg:#00FFFF #ffffff',
+        'selected': 'fg:green',
     })
     
     # Create the application
@@ -309,7 +442,11 @@ def interactive_subreddit_selector(subreddits: List[Dict[str, Any]]) -> List[Dic
         key_bindings=kb,
         style=style,
         full_screen=True,
-        mouse_support=True
+        # Navigation is keyboard-only; skip mouse tracking on dumb/console terminals
+        mouse_support=sys.stdout.isatty() and os.environ.get("TERM", "") not in {"dumb", "linux"},
+        # Coalesce bursts of key events (e.g. a held arrow key) into one redraw
+        max_render_postpone_time=0.01,
+        refresh_interval=None
     )
     
     # Run the application and return selected subreddits
@@ -320,15 +457,19 @@ def interactive_subreddit_selector(subreddits: List[Dict[str, Any]]) -> List[Dic
         if selected is None:
             return []
         
-        return [subreddits[i] for i in selected]
+        return [subreddits[i] for i in sorted(selected)]
     except Exception as e:
         console.print(f"[bold red]Error in UI: {str(e)}[/bold red]")
         
         # Fallback to simple CLI selection if the UI fails
         return cli_fallback_selection(subreddits)
+    finally:
+        render_row.cache_clear()
 
 def cli_fallback_selection(subreddits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Fallback CLI selection method if the UI fails"""
+    from rich.prompt import Prompt
+    
     console.print("[yellow]Using fallback CLI selection method...[/yellow]")
     
     # Display all subreddits
@@ -354,7 +495,8 @@ def prepare_and_send_webhook(
     target_audience: str,
     problem_area: str,
     product_type: str,
-    additional_context: Optional[str] = None
+    additional_context: Optional[str] = None,
+    interactive: bool = True
 ) -> Union[List[Dict[str, Any]], bool]:
     """
     Prepare the payload and send it to the Gumloop API if confirmed.
@@ -365,23 +507,33 @@ def prepare_and_send_webhook(
         problem_area: The problem area the product addresses
         product_type: The type of product
         additional_context: Any additional context about the product
+        interactive: If False, take the email, post limit and send choice from the
+            AUTO_* settings instead of prompting
         
     Returns:
         List of selected subreddits or False if operation was cancelled/failed
     """
-    # Get user email
-    console.print("\n[bold cyan]Please provide your email to receive the analysis report:[/bold cyan]")
-    email = Prompt.ask("Email", default="")
+    from rich.prompt import Prompt
     
-    # Prompt for post limit
-    console.print("\n[bold cyan]How many posts would you like to analyze per subreddit?[/bold cyan]")
-    console.print("[dim](Higher values provide more data but may take longer to process)[/dim]")
-    post_limit = Prompt.ask("Post limit", default="75")
-    
-    # Format the data that would be sent to the API
-    # Remove 'r/' prefix from subreddit names
-    subreddit_names = [sub["name"].replace('r/', '') for sub in selected_subreddits]
-    subscriber_counts = [str(sub["subscribers"]) for sub in selected_subreddits]
+    if interactive:
+        # Get user email
+        console.print("\n[bold cyan]Please provide your email to receive the analysis report:[/bold cyan]")
+        email = Prompt.ask("Email", default="")
+        
+        # Prompt for post limit
+        console.print("\n[bold cyan]How many posts would you like to analyze per subreddit?[/bold cyan]")
+        console.print("[dim](Higher values provide more data but may take longer to process)[/dim]")
+        post_limit = Prompt.ask("Post limit", default="75")
+    else:
+        email, post_limit = AUTO_EMAIL, AUTO_POST_LIMIT
+    
+    # Format the data that would be sent to the API in a single pass
+    # Remove only the leading 'r/' prefix from subreddit names
+    subreddit_names = []
+    subscriber_counts = []
+    for sub in selected_subreddits:
+        subreddit_names.append(sub["name"].removeprefix('r/'))
+        subscriber_counts.append(str(sub["subscribers"]))
     
     # Format as semicolon-separated strings
     subreddits_str = ";".join(subreddit_names)
@@ -393,44 +545,51 @@ def prepare_and_send_webhook(
         console.print(f"[cyan]🗃️ Using Run ID: {run_id}[/cyan]")
     
     # Create the payload according to the required format
+    values = {
+        "email": email,
+        "subscribers": subscribers_str,
+        "post_limit": post_limit,
+        "subreddits": subreddits_str,
+        "audience": target_audience,
+        "problem_area": problem_area,
+        "product_type": product_type,
+        "context": additional_context or "",
+        "run_id": run_id
+    }
     pipeline_inputs = [
-        {"input_name": "email", "value": email},
-        {"input_name": "subscribers", "value": subscribers_str},
-        {"input_name": "post_limit", "value": post_limit},
-        {"input_name": "name", "value": ""},
-        {"input_name": "subreddits", "value": subreddits_str},
-        {"input_name": "audience", "value": target_audience},
-        {"input_name": "problem_area", "value": problem_area},
-        {"input_name": "product_type", "value": product_type},
-        {"input_name": "features", "value": ""},
-        {"input_name": "value_prop", "value": ""},
-        {"input_name": "context", "value": additional_context or ""},
-        {"input_name": "run_id", "value": run_id}  # Add run_id for attribution
+        {"input_name": name, "value": values.get(name, default)}
+        for name, default in _PIPELINE_TEMPLATE
     ]
     
     payload = {
-        "user_id": os.getenv("GUMLOOP_USER_ID", "EZUCg1VIYohJJgKgwDTrTyH2sC32"),
-        "saved_item_id": os.getenv("GUMLOOP_SAVED_ITEM_ID", "aoq3DjMNT9hRP3JMHfosBT"),
+        "user_id": _GUMLOOP_USER_ID,
+        "saved_item_id": _GUMLOOP_SAVED_ITEM_ID,
         "pipeline_inputs": pipeline_inputs
     }
     
-    # Show the formatted payload before sending
-    console.print("\n[bold cyan]API request payload (for verification):[/bold cyan]")
-    formatted_json = json.dumps(payload, indent=2)
-    console.print(f"[dim cyan]{formatted_json}[/dim cyan]")
+    # Only show the full payload up front in verbose mode; test runs print it below
+    verbose = bool(os.getenv("REDDIT_AGENT_VERBOSE"))
+    if verbose:
+        print_payload_preview(payload)
     
     # Ask for confirmation before sending
-    should_send = Prompt.ask(
-        "\nSend this request to the API?", 
-        choices=["y", "n", "test"], 
-        default="test"
-    )
+    if interactive:
+        should_send = Prompt.ask(
+            "\nSend this request to the API?", 
+            choices=["y", "n", "test"], 
+            default="test"
+        )
+    else:
+        should_send = AUTO_SEND if AUTO_SEND.lower() in ("y", "n", "test") else "test"
+        console.print(f"[cyan]Non-interactive run: send choice '{should_send}'[/cyan]")
     
     if should_send.lower() == "n":
         console.print("[yellow]Request cancelled.[/yellow]")
         return False
         
     if should_send.lower() == "test":
+        if not verbose:
+            print_payload_preview(payload)
         console.print("[bold green]✅ Test completed successfully![/bold green]")
         console.print("[yellow]This was a test run. No API request was sent.[/yellow]")
         return selected_subreddits
@@ -438,6 +597,18 @@ def prepare_and_send_webhook(
     # Send the request to the API
     return send_to_webhook(payload, email, selected_subreddits)
 
+def print_payload_preview(payload: Dict[str, Any]) -> None:
+    """
+    Print the API payload for verification.
+    
+    Args:
+        payload: The prepared API payload
+    """
+    console.print("\n[bold cyan]API request payload (for verification):[/bold cyan]")
+    formatted_json = _json_dumps_pretty(payload)
+    # The payload can be long, so skip Rich's markup and highlighting passes
+    console.print(formatted_json, style="dim cyan", markup=False, highlight=False)
+
 def send_to_webhook(
     payload: Dict[str, Any], 
     email: str, 
@@ -454,12 +625,8 @@ def send_to_webhook(
     Returns:
         List of selected subreddits if successful, False otherwise
     """
-    # Set constants for the API
-    API_URL = "https://api.gumloop.com/api/v1/start_pipeline"
-    API_KEY = os.getenv("GUMLOOP_API_KEY")
-    
     # Check if API key exists
-    if not API_KEY:
+    if not _GUMLOOP_API_KEY:
         console.print("[bold red]Error: GUMLOOP_API_KEY environment variable is not set[/bold red]")
         console.print("[yellow]Please set this variable in your .env file and try again[/yellow]")
         return False
@@ -467,19 +634,26 @@ def send_to_webhook(
     # Actually send the request
     try:
         headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {API_KEY}"
+            "Authorization": f"Bearer {_GUMLOOP_API_KEY}"
         }
         
-        response = requests.post(API_URL, json=payload, headers=headers)
+        # Serialize once up front instead of letting requests re-encode with stdlib json
+        body = _json_dumps(payload)
+        future = _EXECUTOR.submit(
+            _SESSION.post, GUMLOOP_API_URL, data=body, headers=headers, timeout=WEBHOOK_TIMEOUT
+        )
+        
+        # The selector UI is already torn down here; show a spinner until the POST completes
+        with console.status("[cyan]Sending request to Gumloop API...[/cyan]"):
+            response = future.result()
         
         if response.status_code == 200:
             console.print("[bold green]✅ Successfully sent request to Gumloop API![/bold green]")
-            console.print(f"Response: {response.text}")
+            console.print("Response:", response.text, markup=False, highlight=False, soft_wrap=True)
             return selected_subreddits
         else:
             console.print(f"[bold red]Error: API returned status code {response.status_code}[/bold red]")
-            console.print(response.text)
+            console.print(response.text, markup=False, highlight=False, soft_wrap=True)
             return False
     except Exception as e:
         console.print(f"[bold red]Error sending to API: {str(e)}[/bold red]")
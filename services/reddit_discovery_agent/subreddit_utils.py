@@ -1,97 +1,340 @@
+import os
+import re
+import json
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
+import threading
 import asyncio
 import aiohttp
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from rich.console import Console
 
+# Optional bounded, expiring in-memory cache
+try:
+    from cachetools import TTLCache
+    TTL_CACHE_AVAILABLE = True
+except ImportError:
+    TTL_CACHE_AVAILABLE = False
+
+# Optional on-disk cache so subreddit lookups survive across runs
+try:
+    import diskcache
+    DISK_CACHE_AVAILABLE = True
+except ImportError:
+    DISK_CACHE_AVAILABLE = False
+
+# Use orjson for decoding Reddit responses when available
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
 # Setup console for better output
 console = Console()
 
-# Simple in-memory cache for subreddit data to reduce API calls
-SUBREDDIT_CACHE = {}
+# Browser-like user agent to avoid potential blocks; chosen once per process so
+# pooled connections keep a consistent client identity
+_USER_AGENT = f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{random.randint(100, 125)}.0.0.0 Safari/537.36'
+_HEADERS = {'User-Agent': _USER_AGENT}
+
+# Retry rate limits and server errors with exponential backoff, deferring
+# to Reddit's Retry-After header when present; the final response is returned, not raised
+REDDIT_MAX_RETRIES = 3
+_RETRY = Retry(
+    total=REDDIT_MAX_RETRIES,
+    backoff_factor=2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    allowed_methods=frozenset(['GET']),
+    raise_on_status=False
+)
+
+# Shared keep-alive session so back-to-back lookups reuse the TLS connection to reddit.com
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': _USER_AGENT})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY))
+
+@functools.lru_cache(maxsize=None)
+def _session_with_retries(max_retries: int) -> requests.Session:
+    """Return a keep-alive session whose retry policy allows max_retries retries."""
+    if max_retries == REDDIT_MAX_RETRIES:
+        return _SESSION
+    session = requests.Session()
+    session.headers.update({'User-Agent': _USER_AGENT})
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY.new(total=max_retries)))
+    return session
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests to stay within an API rate limit."""
+    
+    def __init__(self, capacity: int, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take a token, sleeping only if the bucket has run dry."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+            self.updated = now
+            # Reserve the token up front; a negative balance is the wait owed
+            self.tokens -= 1
+            wait = -self.tokens / self.refill_rate if self.tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+
+# Reddit allows roughly 60 unauthenticated requests per minute
+_RATE_LIMITER = TokenBucket(capacity=60, refill_rate=1.0)
+
+# In-memory cache for subreddit data to reduce API calls. When cachetools is
+# available it is bounded and expiring, with misses (404/403) kept for less time
+# than hits; otherwise both share a plain dict
+if TTL_CACHE_AVAILABLE:
+    SUBREDDIT_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+    _NEGATIVE_CACHE = TTLCache(maxsize=2_000, ttl=300)
+else:
+    SUBREDDIT_CACHE = {}
+    _NEGATIVE_CACHE = SUBREDDIT_CACHE
+
+# TTLCache isn't thread-safe and enrichment looks subreddits up from worker threads
+_CACHE_LOCK = threading.RLock()
+
+# Matches a leading "r/" or "/r/" (any case) on subreddit names
+_PREFIX_RE = re.compile(r'^/?r/', re.IGNORECASE)
+
+def normalize_subreddit(name: str) -> str:
+    """Normalize a subreddit name to its bare lowercase form (no r/ or /r/ prefix)."""
+    return _PREFIX_RE.sub('', name.strip()).lower()
+
+# Reddit subreddit names are 2-21 letters, digits or underscores
+_VALID_NAME = re.compile(r'^[A-Za-z0-9_]{2,21}\Z')
+
+def is_valid_subreddit_name(name: str) -> bool:
+    """Check a normalized subreddit name against Reddit's naming rules."""
+    return _VALID_NAME.match(name) is not None
+
+# Disk tier behind SUBREDDIT_CACHE; misses (404/403) expire sooner than hits
+SUBREDDIT_CACHE_TTL = 24 * 60 * 60  # seconds
+SUBREDDIT_NEGATIVE_CACHE_TTL = 60 * 60  # seconds
+_DISK_CACHE = diskcache.Cache(
+    os.path.expanduser("~/.cache/reddit_discovery"),
+    size_limit=50 * 1024 * 1024
+) if DISK_CACHE_AVAILABLE else None
+
+# Subreddit fields callers actually read; everything else in Reddit's ~30 KB
+# subreddit object is dropped at parse time
+CACHED_SUBREDDIT_FIELDS = frozenset({
+    'display_name', 'title', 'subscribers', 'public_description', 'description',
+    'created_utc', 'over18', 'subreddit_type', 'active_user_count', 'url'
+})
+
+def _slim_subreddit_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the subreddit fields callers use (absent fields stay absent so .get defaults apply)."""
+    return {field: data[field] for field in CACHED_SUBREDDIT_FIELDS if field in data}
+
+# Reddit's /api/info endpoint accepts up to 100 names per request
+BULK_INFO_BATCH_SIZE = 100
+
+# Sentinel for "not cached", since None is a cached negative result
+_MISSING = object()
+
+def _cache_get(clean_subreddit: str) -> Any:
+    """Look up a subreddit in memory, then on disk. Returns _MISSING if neither has it."""
+    with _CACHE_LOCK:
+        cached = SUBREDDIT_CACHE.get(clean_subreddit, _MISSING)
+        if cached is _MISSING:
+            cached = _NEGATIVE_CACHE.get(clean_subreddit, _MISSING)
+    if cached is not _MISSING:
+        return cached
+    if _DISK_CACHE is not None:
+        cached = _DISK_CACHE.get(clean_subreddit, default=_MISSING)
+        if cached is not _MISSING:
+            _cache_set_memory(clean_subreddit, cached)
+            return cached
+    return _MISSING
+
+def _cache_set_memory(clean_subreddit: str, data: Optional[Dict[str, Any]]) -> None:
+    """Store a lookup result in the in-memory tier."""
+    with _CACHE_LOCK:
+        if data is None:
+            _NEGATIVE_CACHE[clean_subreddit] = None
+        else:
+            SUBREDDIT_CACHE[clean_subreddit] = data
 
-def get_subreddit_info(subreddit: str, max_retries: int = 3) -> Optional[Dict[str, Any]]:
+def _cache_set(clean_subreddit: str, data: Optional[Dict[str, Any]]) -> None:
+    """Store a lookup result (None for a missing/private subreddit) in memory and on disk."""
+    _cache_set_memory(clean_subreddit, data)
+    if _DISK_CACHE is not None:
+        expire = SUBREDDIT_NEGATIVE_CACHE_TTL if data is None else SUBREDDIT_CACHE_TTL
+        _DISK_CACHE.set(clean_subreddit, data, expire=expire)
+
+# Maximum number of concurrent metadata lookups when enriching recommendations
+ENRICH_MAX_WORKERS = 8
+ENRICH_MAX_CONCURRENCY = 10
+
+def get_subreddit_info(subreddit: str, max_retries: int = REDDIT_MAX_RETRIES) -> Optional[Dict[str, Any]]:
     """
     Fetch metadata for a subreddit using Reddit's public JSON endpoint.
-    Implements exponential backoff for rate limits.
+    Rate limits and server errors are retried with exponential backoff by the
+    shared session, honoring Reddit's Retry-After header.
     
     Args:
         subreddit: Name of the subreddit without the r/ prefix
-        max_retries: Maximum number of retry attempts for rate limits
+        max_retries: Maximum number of retries for rate limits and server errors
         
     Returns:
         Dictionary containing subreddit metadata or None if the subreddit doesn't exist
         or an error occurred
     """
     # Clean the subreddit name (remove r/ prefix if present)
-    clean_subreddit = subreddit.strip().lower()
-    if clean_subreddit.startswith('r/'):
-        clean_subreddit = clean_subreddit[2:]
+    clean_subreddit = normalize_subreddit(subreddit)
+    
+    # Names Reddit could never accept would always 404, so skip the request
+    if not is_valid_subreddit_name(clean_subreddit):
+        console.print(f"[yellow]'{clean_subreddit}' is not a valid subreddit name[/yellow]")
+        return None
     
     # Check cache first
-    if clean_subreddit in SUBREDDIT_CACHE:
+    cached = _cache_get(clean_subreddit)
+    if cached is not _MISSING:
         console.print(f"[cyan]Using cached data for r/{clean_subreddit}[/cyan]")
-        return SUBREDDIT_CACHE[clean_subreddit]
+        return cached
         
     url = f"https://www.reddit.com/r/{clean_subreddit}/about.json"
     
-    # Use a browser-like user agent to avoid potential blocks
-    headers = {
-        'User-Agent': f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{random.randint(90, 115)}.0.{random.randint(1000, 9999)}.{random.randint(100, 999)} Safari/537.36'
-    }
-    
-    retry_count = 0
-    base_delay = 2  # Start with 2 seconds
+    try:
+        _RATE_LIMITER.acquire()
+        response = _session_with_retries(max_retries).get(url, timeout=10)
+    except Exception as e:
+        console.print(f"[bold red]Exception fetching r/{clean_subreddit}: {str(e)}[/bold red]")
+        return None
     
-    while retry_count <= max_retries:
+    if response.status_code == 200:
+        # Reddit serves HTML for captcha and maintenance pages, so the body may not be JSON
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('kind') == 't5':  # 't5' indicates a subreddit
-                    # Store in cache
-                    SUBREDDIT_CACHE[clean_subreddit] = data.get('data')
-                    return data.get('data')
-                else:
-                    console.print(f"[yellow]Response doesn't contain expected subreddit data for r/{clean_subreddit}[/yellow]")
-                    return None
-            elif response.status_code == 404:
-                console.print(f"[yellow]Subreddit r/{clean_subreddit} doesn't exist[/yellow]")
-                # Cache negative result to avoid repeated lookups
-                SUBREDDIT_CACHE[clean_subreddit] = None
+            data = _json_loads(response.content)
+            if not isinstance(data, dict) or data.get('kind') != 't5':  # 't5' indicates a subreddit
+                console.print(f"[yellow]Response doesn't contain expected subreddit data for r/{clean_subreddit}[/yellow]")
                 return None
-            elif response.status_code == 403:
-                console.print(f"[yellow]Subreddit r/{clean_subreddit} is private or quarantined[/yellow]")
-                # Cache negative result
-                SUBREDDIT_CACHE[clean_subreddit] = None
-                return None
-            elif response.status_code == 429:
-                # Rate limited - implement exponential backoff
-                if retry_count < max_retries:
-                    delay = base_delay * (2 ** retry_count) + random.uniform(0, 1)
-                    console.print(f"[yellow]Rate limited. Retrying in {delay:.2f} seconds...[/yellow]")
-                    time.sleep(delay)
-                    retry_count += 1
-                    continue
-                else:
-                    console.print(f"[bold red]Rate limit exceeded for r/{clean_subreddit} after {max_retries} retries[/bold red]")
-                    return None
-            else:
-                console.print(f"[bold red]Error fetching r/{clean_subreddit}: HTTP {response.status_code}[/bold red]")
-                return None
-                
+            # Store only the fields we use in cache
+            subreddit_data = _slim_subreddit_data(data.get('data') or {})
         except Exception as e:
-            console.print(f"[bold red]Exception fetching r/{clean_subreddit}: {str(e)}[/bold red]")
+            console.print(f"[bold red]Exception parsing r/{clean_subreddit}: {str(e)}[/bold red]")
             return None
+        _cache_set(clean_subreddit, subreddit_data)
+        return subreddit_data
+    elif response.status_code == 404:
+        console.print(f"[yellow]Subreddit r/{clean_subreddit} doesn't exist[/yellow]")
+        # Cache negative result to avoid repeated lookups
+        _cache_set(clean_subreddit, None)
+        return None
+    elif response.status_code == 403:
+        console.print(f"[yellow]Subreddit r/{clean_subreddit} is private or quarantined[/yellow]")
+        # Cache negative result
+        _cache_set(clean_subreddit, None)
+        return None
+    elif response.status_code == 429:
+        console.print(f"[bold red]Rate limit exceeded for r/{clean_subreddit} after {max_retries} retries[/bold red]")
+        return None
+    else:
+        console.print(f"[bold red]Error fetching r/{clean_subreddit}: HTTP {response.status_code}[/bold red]")
+        return None
+
+def _index_info_response(response) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Index the subreddits in an /api/info response by lowercase name.
+    Returns None if the body isn't JSON or doesn't have the expected listing shape.
+    """
+    try:
+        found = {}
+        for child in (_json_loads(response.content).get('data') or {}).get('children') or []:
+            if child.get('kind') == 't5':  # 't5' indicates a subreddit
+                data = child.get('data') or {}
+                found[(data.get('display_name') or '').lower()] = _slim_subreddit_data(data)
+        return found
+    except Exception as e:
+        console.print(f"[bold red]Exception parsing subreddit batch: {str(e)}[/bold red]")
+        return None
+
+def get_subreddits_info_bulk(subreddits: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch metadata for several subreddits at once using Reddit's /api/info endpoint.
+    Cached names are answered locally; the rest are looked up in batches of up to 100.
+    
+    Args:
+        subreddits: Subreddit names, with or without the r/ prefix
         
-        # Break the loop if we reach here (non-retry case)
-        break
+    Returns:
+        Dictionary mapping each cleaned subreddit name to its metadata, or None if the
+        subreddit doesn't exist or couldn't be fetched
+    """
+    results = {}
+    to_fetch = []
     
-    # If we exhausted retries
-    return None
+    for subreddit in subreddits:
+        # Clean the subreddit name (remove r/ prefix if present)
+        clean_subreddit = normalize_subreddit(subreddit)
+        
+        # Names Reddit could never accept would always come back missing
+        if not is_valid_subreddit_name(clean_subreddit):
+            results[clean_subreddit] = None
+            continue
+        
+        # Check cache first
+        cached = _cache_get(clean_subreddit)
+        if cached is not _MISSING:
+            results[clean_subreddit] = cached
+        elif clean_subreddit not in to_fetch:
+            to_fetch.append(clean_subreddit)
+    
+    for start in range(0, len(to_fetch), BULK_INFO_BATCH_SIZE):
+        batch = to_fetch[start:start + BULK_INFO_BATCH_SIZE]
+        
+        try:
+            _RATE_LIMITER.acquire()
+            response = _SESSION.get(
+                "https://www.reddit.com/api/info.json",
+                params={'sr_name': ','.join(batch)},
+                timeout=10
+            )
+        except Exception as e:
+            console.print(f"[bold red]Exception fetching subreddit batch: {str(e)}[/bold red]")
+            response = None
+        
+        if response is not None and response.status_code != 200 and response.status_code < 500:
+            console.print(f"[bold red]Error fetching subreddit batch: HTTP {response.status_code}[/bold red]")
+            for clean_subreddit in batch:
+                results[clean_subreddit] = None
+            continue
+        
+        found = None if response is None or response.status_code != 200 else _index_info_response(response)
+        if found is None:
+            # Fall back to concurrent individual lookups when the bulk endpoint is unavailable
+            # or returned an unusable body
+            with ThreadPoolExecutor(max_workers=min(ENRICH_MAX_WORKERS, len(batch))) as executor:
+                results.update(zip(batch, executor.map(get_subreddit_info, batch)))
+            continue
+        
+        # Cache hits and misses (names absent from the response) in one pass
+        for clean_subreddit in batch:
+            data = found.get(clean_subreddit)
+            _cache_set(clean_subreddit, data)
+            results[clean_subreddit] = data
+    
+    return results
 
 async def get_subreddit_info_async(subreddit: str, max_retries: int = 3, session: Optional[aiohttp.ClientSession] = None) -> Optional[Dict[str, Any]]:
     """
@@ -107,22 +350,21 @@ async def get_subreddit_info_async(subreddit: str, max_retries: int = 3, session
         or an error occurred
     """
     # Clean the subreddit name (remove r/ prefix if present)
-    clean_subreddit = subreddit.strip().lower()
-    if clean_subreddit.startswith('r/'):
-        clean_subreddit = clean_subreddit[2:]
+    clean_subreddit = normalize_subreddit(subreddit)
+    
+    # Names Reddit could never accept would always 404, so skip the request
+    if not is_valid_subreddit_name(clean_subreddit):
+        console.print(f"[yellow]'{clean_subreddit}' is not a valid subreddit name[/yellow]")
+        return None
     
     # Check cache first
-    if clean_subreddit in SUBREDDIT_CACHE:
+    cached = _cache_get(clean_subreddit)
+    if cached is not _MISSING:
         console.print(f"[cyan]Using cached data for r/{clean_subreddit}[/cyan]")
-        return SUBREDDIT_CACHE[clean_subreddit]
+        return cached
         
     url = f"https://www.reddit.com/r/{clean_subreddit}/about.json"
     
-    # Use a browser-like user agent to avoid potential blocks
-    headers = {
-        'User-Agent': f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{random.randint(90, 115)}.0.{random.randint(1000, 9999)}.{random.randint(100, 999)} Safari/537.36'
-    }
-    
     retry_count = 0
     base_delay = 2  # Start with 2 seconds
     
@@ -135,25 +377,26 @@ async def get_subreddit_info_async(subreddit: str, max_retries: int = 3, session
     try:
         while retry_count <= max_retries:
             try:
-                async with session.get(url, headers=headers, timeout=10) as response:
+                async with session.get(url, headers=_HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=_json_loads)
                         if data.get('kind') == 't5':  # 't5' indicates a subreddit
-                            # Store in cache
-                            SUBREDDIT_CACHE[clean_subreddit] = data.get('data')
-                            return data.get('data')
+                            # Store only the fields we use in cache
+                            subreddit_data = _slim_subreddit_data(data.get('data') or {})
+                            _cache_set(clean_subreddit, subreddit_data)
+                            return subreddit_data
                         else:
                             console.print(f"[yellow]Response doesn't contain expected subreddit data for r/{clean_subreddit}[/yellow]")
                             return None
                     elif response.status == 404:
                         console.print(f"[yellow]Subreddit r/{clean_subreddit} doesn't exist[/yellow]")
                         # Cache negative result to avoid repeated lookups
-                        SUBREDDIT_CACHE[clean_subreddit] = None
+                        _cache_set(clean_subreddit, None)
                         return None
                     elif response.status == 403:
                         console.print(f"[yellow]Subreddit r/{clean_subreddit} is private or quarantined[/yellow]")
                         # Cache negative result
-                        SUBREDDIT_CACHE[clean_subreddit] = None
+                        _cache_set(clean_subreddit, None)
                         return None
                     elif response.status == 429:
                         # Rate limited - implement exponential backoff
@@ -210,7 +453,7 @@ def extract_subreddit_metadata(subreddit_data: Dict[str, Any]) -> Dict[str, Any]
 async def enrich_subreddit_recommendations_async(recommendations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Async version: Enrich a list of subreddit recommendations with actual metadata from Reddit.
-    Includes rate limit handling.
+    Lookups run concurrently over a shared session, capped by a semaphore.
     
     Args:
         recommendations: List of subreddit recommendation dictionaries
@@ -219,60 +462,63 @@ async def enrich_subreddit_recommendations_async(recommendations: List[Dict[str,
     Returns:
         The same list with enriched metadata where available
     """
-    enriched_recommendations = []
+    semaphore = asyncio.Semaphore(ENRICH_MAX_CONCURRENCY)
     
-    async with aiohttp.ClientSession() as session:
-        for recommendation in recommendations:
-            subreddit_name = recommendation.get('subreddit_name', '')
-            
-            # Skip if no subreddit name
-            if not subreddit_name:
-                enriched_recommendations.append(recommendation)
-                continue
-                
-            # Clean the subreddit name
-            clean_subreddit = subreddit_name.strip().lower()
-            if clean_subreddit.startswith('r/'):
-                clean_subreddit = clean_subreddit[2:]
+    async def enrich_one(recommendation: Dict[str, Any], session: aiohttp.ClientSession) -> Dict[str, Any]:
+        subreddit_name = recommendation.get('subreddit_name', '')
+        
+        # Skip if no subreddit name
+        if not subreddit_name:
+            return recommendation
             
-            # Get actual subreddit info
+        # Clean the subreddit name
+        clean_subreddit = normalize_subreddit(subreddit_name)
+        
+        # Get actual subreddit info
+        async with semaphore:
             info = await get_subreddit_info_async(clean_subreddit, session=session)
-            
-            if info:
-                # The subreddit exists, update with real data
-                recommendation['subscriber_count'] = str(info.get('subscribers', 0))
-                
-                # Add additional metadata that might be useful for the frontend
-                recommendation['metadata'] = {
-                    'title': info.get('title', ''),
-                    'public_description': info.get('public_description', ''),
-                    'created_utc': info.get('created_utc', 0),
-                    'over18': info.get('over18', False),
-                    'active_user_count': info.get('active_user_count', 0),
-                    'url': info.get('url', ''),
-                    'verified': True
-                }
-            else:
-                # The subreddit doesn't exist or couldn't be fetched
-                # Keep original data but mark as unverified
-                recommendation['metadata'] = {
-                    'verified': False,
-                    'error': 'Could not verify subreddit'
-                }
-            
-            # Add to enriched list
-            enriched_recommendations.append(recommendation)
-            
-            # Add randomized delay to avoid rate limiting
-            delay = random.uniform(0.5, 1.5)  # Reduced delay for async
-            await asyncio.sleep(delay)
+        
+        apply_subreddit_info(recommendation, info)
+        return recommendation
     
-    return enriched_recommendations
+    async with aiohttp.ClientSession() as session:
+        # gather preserves input order
+        return await asyncio.gather(*(enrich_one(rec, session) for rec in recommendations))
+
+def apply_subreddit_info(recommendation: Dict[str, Any], info: Optional[Dict[str, Any]]) -> None:
+    """
+    Update a recommendation in place with fetched subreddit metadata.
+    
+    Args:
+        recommendation: The subreddit recommendation dictionary
+        info: Subreddit data from get_subreddit_info, or None if it couldn't be fetched
+    """
+    if info:
+        # The subreddit exists, update with real data
+        recommendation['subscriber_count'] = str(info.get('subscribers', 0))
+        
+        # Add additional metadata that might be useful for the frontend
+        recommendation['metadata'] = {
+            'title': info.get('title', ''),
+            'public_description': info.get('public_description', ''),
+            'created_utc': info.get('created_utc', 0),
+            'over18': info.get('over18', False),
+            'active_user_count': info.get('active_user_count', 0),
+            'url': info.get('url', ''),
+            'verified': True
+        }
+    else:
+        # The subreddit doesn't exist or couldn't be fetched
+        # Keep original data but mark as unverified
+        recommendation['metadata'] = {
+            'verified': False,
+            'error': 'Could not verify subreddit'
+        }
 
 def enrich_subreddit_recommendations(recommendations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Enrich a list of subreddit recommendations with actual metadata from Reddit.
-    Includes rate limit handling.
+    Subreddits are looked up in bulk through /api/info rather than one request each.
     
     Args:
         recommendations: List of subreddit recommendation dictionaries
@@ -281,59 +527,35 @@ def enrich_subreddit_recommendations(recommendations: List[Dict[str, Any]]) -> L
     Returns:
         The same list with enriched metadata where available
     """
-    enriched_recommendations = []
-    
-    for recommendation in recommendations:
+    # Clean every name up front so uncached subreddits go out in one bulk request
+    clean_names = {}
+    for index, recommendation in enumerate(recommendations):
         subreddit_name = recommendation.get('subreddit_name', '')
         
         # Skip if no subreddit name
-        if not subreddit_name:
-            enriched_recommendations.append(recommendation)
-            continue
-            
-        # Clean the subreddit name
-        clean_subreddit = subreddit_name.strip().lower()
-        if clean_subreddit.startswith('r/'):
-            clean_subreddit = clean_subreddit[2:]
-        
-        # Get actual subreddit info
-        info = get_subreddit_info(clean_subreddit)
-        
-        if info:
-            # The subreddit exists, update with real data
-            recommendation['subscriber_count'] = str(info.get('subscribers', 0))
-            
-            # Add additional metadata that might be useful for the frontend
-            recommendation['metadata'] = {
-                'title': info.get('title', ''),
-                'public_description': info.get('public_description', ''),
-                'created_utc': info.get('created_utc', 0),
-                'over18': info.get('over18', False),
-                'active_user_count': info.get('active_user_count', 0),
-                'url': info.get('url', ''),
-                'verified': True
-            }
-        else:
-            # The subreddit doesn't exist or couldn't be fetched
-            # Keep original data but mark as unverified
-            recommendation['metadata'] = {
-                'verified': False,
-                'error': 'Could not verify subreddit'
-            }
-        
-        # Add to enriched list
-        enriched_recommendations.append(recommendation)
-        
-        # Add randomized delay to avoid rate limiting
-        delay = random.uniform(1.0, 3.0)
-        time.sleep(delay)
+        if subreddit_name:
+            clean_names[index] = normalize_subreddit(subreddit_name)
+    
+    # Cached names are answered locally; the rest share /api/info requests
+    subreddit_infos = get_subreddits_info_bulk(list(clean_names.values()))
     
-    return enriched_recommendations
+    for index, clean_subreddit in clean_names.items():
+        apply_subreddit_info(recommendations[index], subreddit_infos.get(clean_subreddit))
+    
+    return list(recommendations)
 
-def clear_cache():
-    """Clear the subreddit cache."""
-    global SUBREDDIT_CACHE
-    SUBREDDIT_CACHE = {}
+def clear_cache(include_disk: bool = False):
+    """
+    Clear the subreddit cache.
+    
+    Args:
+        include_disk: Also wipe the on-disk cache shared across runs
+    """
+    with _CACHE_LOCK:
+        SUBREDDIT_CACHE.clear()
+        _NEGATIVE_CACHE.clear()
+    if include_disk and _DISK_CACHE is not None:
+        _DISK_CACHE.clear()
     console.print("[green]Subreddit cache cleared[/green]")
 
 # Example usage
@@ -5,14 +5,22 @@ Test script to demonstrate the enhanced subreddit discovery system
 
 import asyncio
 import json
+import aiohttp
 from enhanced_search_agent import EnhancedSearchAgent
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+# Use uvloop's faster event loop for the discovery HTTP calls when available
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 console = Console()
 
-async def test_virtual_organizing_business():
+async def test_virtual_organizing_business(session=None):
     """
     Test the enhanced discovery for the virtual organizing business
     """
@@ -27,7 +35,8 @@ async def test_virtual_organizing_business():
         product_type="Virtual organizing services and home organization solutions",
         problem_area="Feeling overwhelmed by clutter and disorganization at home",
         target_audience="Busy professionals and parents who need help organizing their homes",
-        additional_context="Offers virtual consultations, organizing courses, and subscription services for ongoing support. Price ranges from $24.99 for courses to $850 for comprehensive packages."
+        additional_context="Offers virtual consultations, organizing courses, and subscription services for ongoing support. Price ranges from $24.99 for courses to $850 for comprehensive packages.",
+        session=session
     )
     
     # Run the discovery
@@ -38,7 +47,7 @@ async def test_virtual_organizing_business():
     
     return results
 
-async def test_saas_business():
+async def test_saas_business(session=None):
     """
     Test the enhanced discovery for a SaaS business
     """
@@ -53,7 +62,8 @@ async def test_saas_business():
         product_type="Project management and team collaboration software",
         problem_area="Teams struggling with project coordination and communication",
         target_audience="Small to medium business owners and project managers",
-        additional_context="Cloud-based solution with integrations, real-time collaboration, and reporting features"
+        additional_context="Cloud-based solution with integrations, real-time collaboration, and reporting features",
+        session=session
     )
     
     # Run the discovery
@@ -64,9 +74,10 @@ async def test_saas_business():
     
     return results
 
-async def compare_with_original_results():
+async def compare_with_original_results(enhanced_results=None, session=None):
     """
-    Compare enhanced results with what the original system might have found
+    Compare enhanced results with what the original system might have found.
+    Reuses enhanced_results from an earlier organizing run when given.
     """
     console.print(Panel.fit(
         "📊 Comparison: Enhanced vs Original Discovery",
@@ -81,14 +92,16 @@ async def compare_with_original_results():
         "productivity"
     ]
     
-    # Run enhanced discovery
-    agent = EnhancedSearchAgent(
-        product_type="Virtual organizing services",
-        problem_area="Home clutter and disorganization",
-        target_audience="Busy professionals and parents"
-    )
-    
-    enhanced_results = await agent.discover_subreddits()
+    # Run enhanced discovery only if no earlier results were passed in
+    if enhanced_results is None:
+        agent = EnhancedSearchAgent(
+            product_type="Virtual organizing services",
+            problem_area="Home clutter and disorganization",
+            target_audience="Busy professionals and parents",
+            session=session
+        )
+        
+        enhanced_results = await agent.discover_subreddits()
     
     # Create comparison table
     table = Table(title="Discovery Method Comparison")
@@ -96,56 +109,32 @@ async def compare_with_original_results():
     table.add_column("Original System", style="red")
     table.add_column("Enhanced System", style="green")
     
-    table.add_row(
-        "Discovery Method",
-        "Basic keyword search",
-        "AI-powered multi-source"
-    )
-    table.add_row(
-        "Number of Sources",
-        "1 (basic search)",
-        "2+ (Perplexity + Firecrawl)"
-    )
-    table.add_row(
-        "Subreddits Found",
-        str(len(original_results)),
-        str(len(enhanced_results['validated_subreddits']))
-    )
-    table.add_row(
-        "Quality Validation",
-        "None",
-        "Full validation + metadata"
-    )
-    table.add_row(
-        "Categorization",
-        "None",
-        "Primary/Secondary/Niche"
-    )
-    table.add_row(
-        "Relevance Scoring",
-        "None",
-        "AI-powered 1-10 scale"
-    )
-    table.add_row(
-        "Engagement Strategy",
-        "None",
-        "Specific recommendations"
-    )
+    rows = [
+        ("Discovery Method", "Basic keyword search", "AI-powered multi-source"),
+        ("Number of Sources", "1 (basic search)", "2+ (Perplexity + Firecrawl)"),
+        ("Subreddits Found", str(len(original_results)), str(len(enhanced_results['validated_subreddits']))),
+        ("Quality Validation", "None", "Full validation + metadata"),
+        ("Categorization", "None", "Primary/Secondary/Niche"),
+        ("Relevance Scoring", "None", "AI-powered 1-10 scale"),
+        ("Engagement Strategy", "None", "Specific recommendations"),
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     
     # Show specific examples
     console.print("\n[red]Original Results (Poor Quality):[/red]")
-    for sub in original_results:
-        console.print(f"  • r/{sub} - No context or validation")
+    console.print("\n".join(f"  • r/{sub} - No context or validation" for sub in original_results))
     
     console.print("\n[green]Enhanced Results (High Quality):[/green]")
     primary_recs = enhanced_results['final_recommendations'].get('primary', [])
     for rec in primary_recs[:3]:  # Show top 3
-        console.print(f"  • r/{rec['name']} - Score: {rec['relevance_score']}/10")
-        console.print(f"    Reason: {rec['relevance_reason'][:80]}...")
-        console.print(f"    Strategy: {rec['engagement_approach'][:80]}...")
-        console.print()
+        console.print(
+            f"  • r/{rec['name']} - Score: {rec['relevance_score']}/10\n"
+            f"    Reason: {rec['relevance_reason'][:80]}...\n"
+            f"    Strategy: {rec['engagement_approach'][:80]}...\n"
+        )
 
 async def main():
     """
@@ -153,18 +142,19 @@ async def main():
     """
     console.print("[bold blue]🚀 Enhanced Subreddit Discovery Test Suite[/bold blue]\n")
     
-    # Test 1: Virtual organizing business
-    organizing_results = await test_virtual_organizing_business()
-    
-    console.print("\n" + "="*80 + "\n")
-    
-    # Test 2: SaaS business
-    saas_results = await test_saas_business()
-    
-    console.print("\n" + "="*80 + "\n")
-    
-    # Comparison with original
-    await compare_with_original_results()
+    # One HTTP session for every discovery so Perplexity/Firecrawl connections are reused
+    async with aiohttp.ClientSession() as session:
+        # Tests 1 and 2 are independent and mostly waiting on the network, so run them together.
+        # Each test prints its results table as soon as its own discovery finishes.
+        organizing_results, saas_results = await asyncio.gather(
+            test_virtual_organizing_business(session),
+            test_saas_business(session)
+        )
+        
+        console.print("\n" + "="*80 + "\n")
+        
+        # Comparison with original, reusing the organizing run from test 1
+        await compare_with_original_results(organizing_results, session)
     
     # Summary
     console.print(Panel.fit(
@@ -6,6 +6,13 @@ import asyncio
 import sys
 from enhanced_search_agent import EnhancedSearchAgent
 
+# Use uvloop's faster event loop for the discovery HTTP calls when available
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 async def test_enhanced_agent():
     """Quick test of the enhanced search agent with a simple example"""
     print("🧪 Testing Enhanced Search Agent...")
@@ -32,8 +39,9 @@ async def test_enhanced_agent():
         validated = results.get('validated_subreddits', [])
         if validated:
             print(f"\n📋 Sample validated subreddits:")
-            for sub in validated[:5]:  # Show first 5
-                print(f"   - r/{sub['name']} ({sub['subscribers']} subscribers)")
+            print("\n".join(  # Show first 5
+                f"   - r/{sub['name']} ({sub['subscribers']} subscribers)" for sub in validated[:5]
+            ))
         
         # Show final recommendations
         final_recs = results.get('final_recommendations', {})
@@ -41,8 +49,9 @@ async def test_enhanced_agent():
             primary = final_recs.get('primary', [])
             if primary:
                 print(f"\n🎯 Top primary recommendations:")
-                for rec in primary[:3]:  # Show top 3
-                    print(f"   - r/{rec['name']} (score: {rec['relevance_score']})")
+                print("\n".join(  # Show top 3
+                    f"   - r/{rec['name']} (score: {rec['relevance_score']})" for rec in primary[:3]
+                ))
         
         return True
         